@@ -1,5 +1,17 @@
-from typing import Any, List
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 from abc import ABC, abstractmethod
+from array import array
+from operator import mul
+
+try:
+    import numpy
+except ImportError:
+    np: Any = None
+else:
+    np = numpy
+
+INTEGER_CODES: str = "?bBhHiIlLqQ"
+INT64_LIMIT: int = 1 << 63
 
 
 class EmptyError(Exception):
@@ -25,9 +37,35 @@ class DataProcessor(ABC):
 
 
 class NumericProcessor(DataProcessor):
-    """NumericProcessor blueprint to process numeric data."""
+    """
+    NumericProcessor blueprint to process numeric data.
+    Lists are checked element by element; array.array, memoryview and
+    NumPy buffers are checked once by dtype and aggregated vectorized.
+    """
+
+    @staticmethod
+    def buffer_code(numbers_list: Any) -> Optional[str]:
+        """Return the element type code of a numeric buffer, else None."""
+        if isinstance(numbers_list, array):
+            return numbers_list.typecode
+        if isinstance(numbers_list, memoryview):
+            if numbers_list.ndim != 1:
+                raise ValueError("memoryview should be one-dimensional.")
+            return numbers_list.format.lstrip("@=<>!")
+        if np is not None and isinstance(numbers_list, np.ndarray):
+            if numbers_list.ndim != 1:
+                raise ValueError("NumPy array should be one-dimensional.")
+            code: str = numbers_list.dtype.char
+            return code
+        return None
 
     def validate(self, numbers_list: Any) -> bool:
+        code: Optional[str] = self.buffer_code(numbers_list)
+        if code is not None:
+            if code not in INTEGER_CODES:
+                raise ValueError(
+                    f"'{code}' buffer should hold integer numbers.")
+            return len(numbers_list) > 0
         if not numbers_list:
             return False
         for n in numbers_list:
@@ -35,13 +73,58 @@ class NumericProcessor(DataProcessor):
                 raise ValueError(f"'{n}' should be a number.")
         return True
 
+    def summarize(self, numbers_list: Any) -> Dict[str, Union[int, float]]:
+        """
+        Compute count, sum, mean, population variance, min and max.
+        Sums stay exact Python integers on every path, so buffers give
+        the same results as lists.
+        """
+        if not self.validate(numbers_list):
+            raise EmptyError("List is empty.")
+        return self.aggregate(numbers_list)
+
+    def aggregate(self, numbers_list: Any) -> Dict[str, Union[int, float]]:
+        """Compute the aggregates of already validated numbers."""
+        if self.buffer_code(numbers_list) is None:
+            total: int = sum(numbers_list)
+            squares: int = sum(n * n for n in numbers_list)
+            low: int = min(numbers_list)
+            high: int = max(numbers_list)
+        elif np is not None:
+            values: Any = np.asarray(numbers_list)
+            low = int(values.min())
+            high = int(values.max())
+            magnitude: int = max(abs(low), abs(high))
+            bound: int = len(values) * magnitude
+            wide: Any = values.astype(np.int64, copy=False)
+            total = (int(wide.sum()) if bound < INT64_LIMIT
+                     else sum(values.tolist()))
+            squares = (int(wide @ wide) if bound * magnitude < INT64_LIMIT
+                       else sum(n * n for n in values.tolist()))
+        else:
+            total = sum(numbers_list)
+            squares = sum(map(mul, numbers_list, numbers_list))
+            low = min(numbers_list)
+            high = max(numbers_list)
+        length: int = len(numbers_list)
+        return {
+            "count": length,
+            "sum": total,
+            "mean": total / length,
+            "variance": (length * squares - total * total) / length ** 2,
+            "min": low,
+            "max": high
+        }
+
     def process(self, numbers_list: Any) -> str:
         if self.validate(numbers_list):
-            total: int = 0
-            for n in numbers_list:
-                total += n
             length: int = len(numbers_list)
-            avg: int = total / length
+            total: Union[int, float]
+            if self.buffer_code(numbers_list) is None:
+                total = sum(numbers_list)
+            else:
+                total = self.aggregate(numbers_list)["sum"]
+            avg: float = total / length
 
             return f"Processed {length} numeric values, sum={total}, avg={avg}"
 
@@ -49,23 +132,132 @@ class NumericProcessor(DataProcessor):
         return f"{result}"
 
 
+class MisraGries:
+    """
+    Misra-Gries heavy-hitters sketch over at most capacity counters.
+    Every word seen more than total / (capacity + 1) times is kept, and
+    its count is low by at most that much.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        if capacity < 1:
+            raise ValueError("Sketch capacity should be positive.")
+        self.capacity: int = capacity
+        self.counters: Dict[str, int] = {}
+        self.total: int = 0
+
+    def update(self, words: Iterable[str]) -> None:
+        """Count a run of words."""
+        counters: Dict[str, int] = self.counters
+        capacity: int = self.capacity
+        for word in words:
+            self.total += 1
+            if word in counters:
+                counters[word] += 1
+            elif len(counters) < capacity:
+                counters[word] = 1
+            else:
+                for key in list(counters):
+                    if counters[key] == 1:
+                        del counters[key]
+                    else:
+                        counters[key] -= 1
+
+    def top(self, k: int) -> List[Tuple[str, int]]:
+        """Return the k most frequent words with their estimated counts."""
+        ranked = sorted(self.counters.items(), key=lambda item: -item[1])
+        return ranked[:k]
+
+
 class TextProcessor(DataProcessor):
-    """TextProcessor blueprint to process text."""
+    """
+    TextProcessor blueprint to process text.
+    Text is counted chunk by chunk, so a string, a text file object or
+    an iterator of string chunks is processed in bounded memory. With
+    top_k, the most frequent words are tracked in a Misra-Gries sketch.
+    """
+
+    def __init__(
+        self,
+        top_k: Optional[int] = None,
+        sketch_size: Optional[int] = None,
+        chunk_size: int = 1 << 16
+    ) -> None:
+        self.top_k: Optional[int] = top_k
+        self.sketch_size: Optional[int] = sketch_size
+        self.chunk_size: int = chunk_size
 
     def validate(self, text: Any) -> bool:
         """Validate text input."""
+        if hasattr(text, "read") or isinstance(text, (Iterator, list)):
+            return True
         if not isinstance(text, str):
             raise ValueError("Text should be string.")
         if len(text) == 0:
             return False
         return True
 
+    def chunks(self, text: Any) -> Iterator[str]:
+        """Yield the text in chunks of at most chunk_size characters."""
+        size: int = self.chunk_size
+        if isinstance(text, str):
+            for start in range(0, len(text), size):
+                yield text[start:start + size]
+        elif hasattr(text, "read"):
+            yield from iter(lambda: text.read(size), "")
+        else:
+            yield from text
+
+    def analyze(self, text: Any) -> Dict[str, Any]:
+        """
+        Count characters and words incrementally. A word cut by a chunk
+        boundary is carried over and joined with the next chunk.
+        """
+        sketch: Optional[MisraGries] = None
+        if self.top_k:
+            sketch = MisraGries(self.sketch_size or 10 * self.top_k)
+        characters: int = 0
+        word_count: int = 0
+        carry: str = ""
+        for chunk in self.chunks(text):
+            if not isinstance(chunk, str):
+                raise ValueError("Text chunks should be strings.")
+            if not chunk:
+                continue
+            characters += len(chunk)
+            words: List[str] = chunk.split()
+            if carry:
+                if chunk[0].isspace():
+                    words.insert(0, carry)
+                else:
+                    words[0] = carry + words[0]
+            carry = "" if chunk[-1].isspace() else words.pop()
+            word_count += len(words)
+            if sketch is not None:
+                sketch.update(words)
+        if carry:
+            word_count += 1
+            if sketch is not None:
+                sketch.update((carry,))
+        result: Dict[str, Any] = {
+            "characters": characters,
+            "words": word_count
+        }
+        if sketch is not None:
+            result["top"] = sketch.top(self.top_k or 0)
+        return result
+
     def process(self, text: Any) -> str:
         """Process text input."""
         if self.validate(text):
-            words: List[str] = text.split()
-            word_count: int = len(words)
-            return f"{len(text)} characters, {word_count} words"
+            result: Dict[str, Any] = self.analyze(text)
+            output: str = (f"{result['characters']} characters, "
+                           f"{result['words']} words")
+            if "top" in result:
+                top: str = ", ".join(
+                    f"{word}({count})" for word, count in result["top"])
+                output += f", top: {top}"
+            return output
 
     def format_output(self, result: str) -> str:
         return f"Processed text: {result}"
@@ -1,9 +1,325 @@
+import math
+import mmap
+import os
+import re
+import socket
+import stat
+import time
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, Union
+from array import array
+from collections import deque
+from concurrent.futures import (
+    Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor,
+    TimeoutError as FutureTimeout
+)
+from functools import lru_cache
+from itertools import islice
+from typing import (
+    Any, Callable, Dict, Iterable, Iterator, List, NoReturn, Optional,
+    Tuple, Union
+)
+
+
+Predicate = Callable[..., bool]
+
+CATCH_ALL = "*"
+
+_TOKEN = re.compile(
+    r"\s*(?:(?P<number>-?\d+(?:\.\d+)?)"
+    r"|(?P<string>\"[^\"]*\"|'[^']*')"
+    r"|(?P<symbol>>=|<=|==|!=|>|<|\(|\)|,)"
+    r"|(?P<name>[A-Za-z_]\w*))"
+)
+_KEYWORDS = ("and", "or", "not", "in")
+_NUMBER = (int, float)
+
+
+class _PredicateParser:
+    """
+    Recursive-descent parser turning a filter expression into Python
+    source over the given field names:
+
+        expr       := and ("or" and)*
+        and        := not ("and" not)*
+        not        := "not" not | "(" expr ")" | comparison
+        comparison := field (op literal | ["not"] "in" "(" literals ")")
+
+    Literals are numbers, quoted strings or bare words. Ordering
+    comparisons against numbers are false for non-numeric fields, and
+    against strings false for non-string fields.
+    """
+
+    def __init__(self, expression: str, fields: Tuple[str, ...]) -> None:
+        """Tokenize the expression."""
+        self.expression: str = expression
+        self.fields: Tuple[str, ...] = fields
+        self.tokens: List[Tuple[str, str]] = []
+        position: int = 0
+        text: str = expression.rstrip()
+        while position < len(text):
+            match = _TOKEN.match(text, position)
+            if match is None or match.end() == position:
+                self.fail(f"unexpected input at {position}")
+            kind: str = match.lastgroup or ""
+            self.tokens.append((kind, match.group(kind)))
+            position = match.end()
+        self.index: int = 0
+
+    def fail(self, reason: str) -> NoReturn:
+        """Raise a ValueError describing the bad expression."""
+        raise ValueError(
+            f"Invalid filter expression {self.expression!r}: {reason}")
+
+    def peek(self) -> Tuple[str, str]:
+        """Return the next token without consuming it."""
+        if self.index < len(self.tokens):
+            return self.tokens[self.index]
+        return ("end", "")
+
+    def take(self, value: Optional[str] = None) -> Tuple[str, str]:
+        """Consume the next token, checking its text when given."""
+        token = self.peek()
+        if token[0] == "end" or (value is not None and token[1] != value):
+            self.fail(f"expected {value or 'more input'}")
+        self.index += 1
+        return token
+
+    def parse(self) -> str:
+        """Return the Python source of the whole expression."""
+        source: str = self.parse_or()
+        if self.peek()[0] != "end":
+            self.fail(f"unexpected {self.peek()[1]!r}")
+        return source
+
+    def parse_or(self) -> str:
+        """Parse a chain of or-ed terms."""
+        parts: List[str] = [self.parse_and()]
+        while self.peek() == ("name", "or"):
+            self.take()
+            parts.append(self.parse_and())
+        return parts[0] if len(parts) == 1 else f"({' or '.join(parts)})"
+
+    def parse_and(self) -> str:
+        """Parse a chain of and-ed terms."""
+        parts: List[str] = [self.parse_not()]
+        while self.peek() == ("name", "and"):
+            self.take()
+            parts.append(self.parse_not())
+        return parts[0] if len(parts) == 1 else f"({' and '.join(parts)})"
+
+    def parse_not(self) -> str:
+        """Parse a negation, a parenthesised group or a comparison."""
+        if self.peek() == ("name", "not"):
+            self.take()
+            return f"(not {self.parse_not()})"
+        if self.peek() == ("symbol", "("):
+            self.take()
+            source: str = self.parse_or()
+            self.take(")")
+            return source
+        return self.parse_comparison()
+
+    def parse_literal(self) -> Union[str, int, float]:
+        """Parse a number, a quoted string or a bare word."""
+        kind, text = self.take()
+        if kind == "number":
+            return float(text) if "." in text else int(text)
+        if kind == "string":
+            return text[1:-1]
+        if kind == "name" and text not in _KEYWORDS:
+            return text
+        self.fail(f"expected a literal, got {text!r}")
+
+    def parse_comparison(self) -> str:
+        """Parse a field comparison or membership test."""
+        kind, field = self.take()
+        if kind != "name" or field not in self.fields:
+            self.fail(f"unknown field {field!r} "
+                      f"(fields: {', '.join(self.fields)})")
+        kind, op = self.take()
+        negate: bool = False
+        if op == "not":
+            negate = True
+            kind, op = self.take("in")
+        if op == "in":
+            self.take("(")
+            values: List[Union[str, int, float]] = [self.parse_literal()]
+            while self.peek() == ("symbol", ","):
+                self.take()
+                values.append(self.parse_literal())
+            self.take(")")
+            members: str = ", ".join(repr(value) for value in values)
+            return (f"({field} {'not in' if negate else 'in'} "
+                    f"({members},))")
+        if kind != "symbol" or op in ("(", ")", ","):
+            self.fail(f"expected a comparison after {field!r}")
+        value = self.parse_literal()
+        if op in ("==", "!="):
+            return f"({field} {op} {value!r})"
+        guard: str = "_NUMBER" if isinstance(value, _NUMBER) else "str"
+        return f"(isinstance({field}, {guard}) and {field} {op} {value!r})"
+
+
+@lru_cache(maxsize=256)
+def compile_predicate(expression: str, fields: Tuple[str, ...]) -> Predicate:
+    """
+    Compile a filter expression such as "amount > 100 and op in (buy,
+    sell)" into a callable taking the fields positionally. Compiled
+    predicates are cached by expression text and field names.
+    """
+    source: str = _PredicateParser(expression, fields).parse()
+    code = compile(f"lambda {', '.join(fields)}: {source}",
+                   f"<filter {expression!r}>", "eval")
+    predicate: Predicate = eval(code, {"__builtins__": {},
+                                       "isinstance": isinstance,
+                                       "str": str,
+                                       "_NUMBER": _NUMBER})
+    return predicate
+
+
+def parse_field(item: Any) -> Tuple[Any, Any]:
+    """
+    Split a "key:value" record into its key and value, with the value
+    converted to a number when it is numeric and None when absent.
+    """
+    if not isinstance(item, str):
+        return None, item
+    key, sep, raw = item.partition(":")
+    if not sep:
+        return key, None
+    try:
+        return key, int(raw)
+    except ValueError:
+        pass
+    try:
+        return key, float(raw)
+    except ValueError:
+        return key, raw
+
+
+class LineSource(ABC):
+    """
+    Source of line-delimited records cut into micro-batches.
+    The input is read in blocks of block_size bytes that are split into
+    lines in one call, so iterating a source yields lists of at most
+    batch_size records while holding only about one block in memory.
+    """
+
+    def __init__(
+        self,
+        batch_size: int = 1024,
+        encoding: str = "utf-8",
+        block_size: int = 1 << 20
+    ) -> None:
+        """Initialize the micro-batch, encoding and read block sizes."""
+        if batch_size < 1 or block_size < 1:
+            raise ValueError("batch_size and block_size must be positive")
+        self.batch_size: int = batch_size
+        self.encoding: str = encoding
+        self.block_size: int = block_size
+
+    @abstractmethod
+    def blocks(self) -> Iterator[bytes]:
+        """Yield the raw input in consecutive blocks."""
+        pass
+
+    def lines(self) -> Iterator[str]:
+        """
+        Yield the decoded, non-empty records of the source. A record cut
+        by a block boundary is carried over to the next block.
+        """
+        encoding: str = self.encoding
+        carry: bytes = b""
+        for block in self.blocks():
+            if carry:
+                block = carry + block
+            cut: int = block.rfind(b"\n")
+            if cut == -1:
+                carry = block
+                continue
+            carry = block[cut + 1:]
+            yield from filter(None, block[:cut].decode(encoding).splitlines())
+        if carry:
+            yield from filter(None, carry.decode(encoding).splitlines())
+
+    def __iter__(self) -> Iterator[List[str]]:
+        """Yield the records in micro-batches."""
+        lines: Iterator[str] = self.lines()
+        while True:
+            batch: List[str] = list(islice(lines, self.batch_size))
+            if not batch:
+                return
+            yield batch
+
+
+class FileSource(LineSource):
+    """
+    Line source over a file or named pipe.
+    Regular files are read through a memory map, so inputs larger than
+    RAM are paged in and out by the OS; pipes and empty files fall back
+    to buffered reads.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        batch_size: int = 1024,
+        encoding: str = "utf-8",
+        block_size: int = 1 << 20
+    ) -> None:
+        """Initialize the source for the given path."""
+        super().__init__(batch_size, encoding, block_size)
+        self.path: str = path
+
+    def blocks(self) -> Iterator[bytes]:
+        """Yield blocks from a memory map, or from a buffered reader."""
+        size: int = self.block_size
+        with open(self.path, "rb") as handle:
+            info = os.fstat(handle.fileno())
+            if not stat.S_ISREG(info.st_mode) or info.st_size == 0:
+                yield from iter(lambda: handle.read1(size), b"")
+                return
+            with mmap.mmap(handle.fileno(), 0,
+                           access=mmap.ACCESS_READ) as mapped:
+                for offset in range(0, len(mapped), size):
+                    yield mapped[offset:offset + size]
+
+
+class SocketSource(LineSource):
+    """Line source reading records from a TCP connection until EOF."""
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        batch_size: int = 1024,
+        encoding: str = "utf-8",
+        timeout: Optional[float] = None,
+        block_size: int = 1 << 16
+    ) -> None:
+        """Initialize the source for the given address."""
+        super().__init__(batch_size, encoding, block_size)
+        self.address: Tuple[str, int] = (host, port)
+        self.timeout: Optional[float] = timeout
+
+    def blocks(self) -> Iterator[bytes]:
+        """Connect and yield data as it arrives."""
+        size: int = self.block_size
+        with socket.create_connection(self.address, self.timeout) as sock:
+            yield from iter(lambda: sock.recv(size), b"")
 
 
 class DataStream(ABC):
-    """Abstract base class defining the core streaming interface."""
+    """
+    Abstract base class defining the core streaming interface.
+    routes lists the record prefixes (the part before ":") a stream
+    handles; a stream without routes receives every record. The
+    CATCH_ALL route matches the records no other route claims.
+    """
+
+    routes: Tuple[str, ...] = ()
+    filter_fields: Tuple[str, ...] = ("key", "value")
+    named_filters: Dict[str, str] = {}
 
     def __init__(self, stream_id: str) -> None:
         """Initialize the stream with a unique identifier."""
@@ -19,120 +335,447 @@ class DataStream(ABC):
         data_batch: List[Any],
         criteria: Optional[str] = None
     ) -> List[Any]:
-        """Filter data based on optional criteria."""
-        return data_batch
+        """
+        Filter data based on optional criteria.
+        criteria is a filter expression over filter_fields, or the name
+        of one of the stream's named_filters. The batch is parsed once
+        into rows and the compiled predicate runs over them in a single
+        pass.
+        """
+        if criteria is None:
+            return data_batch
+        positions, rows = self.filter_rows(data_batch)
+        return self.filter_parsed(data_batch, criteria, positions, rows)
+
+    def filter_parsed(
+        self,
+        data_batch: List[Any],
+        criteria: str,
+        positions: Iterable[int],
+        rows: Iterable[Tuple[Any, ...]]
+    ) -> List[Any]:
+        """Keep the batch items whose parsed rows match criteria."""
+        expression: str = self.named_filters.get(criteria, criteria)
+        predicate: Predicate = compile_predicate(
+            expression, self.filter_fields)
+        return [
+            data_batch[position]
+            for position, row in zip(positions, rows)
+            if predicate(*row)
+        ]
+
+    def filter_rows(
+        self, data_batch: List[Any]
+    ) -> Tuple[Iterable[int], Iterable[Tuple[Any, ...]]]:
+        """
+        Return the batch positions and the filter_fields row of each
+        record that can be filtered.
+        """
+        return range(len(data_batch)), map(parse_field, data_batch)
+
+    def process_source(self, source: Iterable[List[Any]]) -> Iterator[str]:
+        """Process every micro-batch of a source, yielding each result."""
+        for data_batch in source:
+            yield self.process_batch(data_batch)
 
     def get_stats(self) -> Dict[str, Union[str, int, float]]:
         """Return stream statistics."""
         return {"stream_id": self.stream_id}
 
 
+class RunningStats:
+    """Incremental count, mean, variance (Welford), min and max."""
+
+    __slots__ = ("count", "mean", "m2", "min", "max")
+
+    def __init__(self) -> None:
+        """Start with no observations."""
+        self.count: int = 0
+        self.mean: float = 0.0
+        self.m2: float = 0.0
+        self.min: float = math.inf
+        self.max: float = -math.inf
+
+    def update(self, value: float) -> None:
+        """Fold one observation into the aggregates in O(1)."""
+        self.count += 1
+        delta: float = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        if value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    @property
+    def variance(self) -> float:
+        """Sample variance, 0.0 until two values have been seen."""
+        return self.m2 / (self.count - 1) if self.count > 1 else 0.0
+
+    def to_dict(self) -> Dict[str, float]:
+        """Return the aggregates as a dictionary."""
+        return {
+            "count": self.count,
+            "mean": self.mean,
+            "variance": self.variance,
+            "std": math.sqrt(self.variance),
+            "min": self.min,
+            "max": self.max
+        }
+
+
 class SensorStream(DataStream):
     """Stream handler for environmental sensor data."""
 
+    sensor_keys: Tuple[str, ...] = ("temp", "humidity", "pressure")
+    routes: Tuple[str, ...] = sensor_keys
+    filter_fields: Tuple[str, ...] = ("sensor", "value")
+    named_filters: Dict[str, str] = {"temp": "sensor == temp"}
+
     def __init__(self, stream_id: str) -> None:
         """Initialize the sensor stream."""
         super().__init__(stream_id)
         self.count: int = 0
+        self.sensors: Dict[str, RunningStats] = {}
         self.stream_type: str = "Environmental Data"
         print("Initializing Sensor Stream...")
         print(f"Stream ID: {self.stream_id}, Type: {self.stream_type}")
 
     def process_batch(self, data_batch: List[Any]) -> str:
-        """Process a batch of sensor readings."""
+        """
+        Process a batch of sensor readings.
+        Each "key:value" reading is parsed once and folded into the
+        running aggregates of its sensor, so earlier batches never need
+        to be re-read.
+        """
         batch_size = len(data_batch)
         self.count += batch_size
-        avg_temp = next(
-            (item.split(":")[1] for item in data_batch if "temp" in item),
-            "N/A"
-        )
+        temp_total: float = 0.0
+        temp_count: int = 0
+        for item in data_batch:
+            if not isinstance(item, str):
+                continue
+            key, sep, raw_value = item.partition(":")
+            if not sep or key not in self.sensor_keys:
+                continue
+            try:
+                value: float = float(raw_value)
+            except ValueError:
+                continue
+            stats: Optional[RunningStats] = self.sensors.get(key)
+            if stats is None:
+                stats = self.sensors[key] = RunningStats()
+            stats.update(value)
+            if key == "temp":
+                temp_total += value
+                temp_count += 1
+        avg_temp: str = (
+            f"{temp_total / temp_count:.1f}" if temp_count else "N/A")
         return (
             f"Sensor analysis: {batch_size} readings processed, "
             f"avg temp: {avg_temp}°C"
         )
 
-    def filter_data(
-        self,
-        data_batch: List[Any],
-        criteria: Optional[str] = None
-    ) -> List[Any]:
-        """Filter sensor data by criteria."""
-        if criteria == "temp":
-            return [item for item in data_batch if "temp" in item]
-        return data_batch
-
-    def get_stats(self) -> Dict[str, Union[str, int, float]]:
-        """Return sensor stream statistics."""
+    def get_stats(self) -> Dict[str, Any]:
+        """Return sensor stream statistics, including per-sensor aggregates."""
         return {
             "stream_id": self.stream_id,
-            "total_readings": self.count
+            "total_readings": self.count,
+            "sensors": {
+                key: stats.to_dict() for key, stats in self.sensors.items()
+            }
         }
 
 
+BUY: int = 1
+SELL: int = -1
+OP_CODES: Dict[str, int] = {"buy": BUY, "sell": SELL}
+OP_NAMES: Dict[int, str] = {code: name for name, code in OP_CODES.items()}
+
+
+class TransactionColumns:
+    """A transaction batch parsed once into typed columns."""
+
+    __slots__ = ("ops", "amounts", "positions", "buys", "sells", "size")
+
+    def __init__(self, data_batch: List[Any]) -> None:
+        """
+        Parse every "buy:N" / "sell:N" item of the batch in one pass.
+        Row i holds the op code, the amount and the position of the
+        item in the original batch; other items are skipped. Amounts
+        are packed as 64-bit integers until one does not fit, after
+        which the column falls back to a list of Python ints.
+        """
+        self.ops: array[int] = array("b")
+        self.amounts: Union[array[int], List[int]] = array("q")
+        self.positions: array[int] = array("q")
+        self.buys: int = 0
+        self.sells: int = 0
+        self.size: int = len(data_batch)
+        for position, item in enumerate(data_batch):
+            if not isinstance(item, str):
+                continue
+            key, sep, raw_amount = item.partition(":")
+            op: Optional[int] = OP_CODES.get(key)
+            if op is None or not sep:
+                continue
+            try:
+                amount: int = int(raw_amount)
+            except ValueError:
+                continue
+            try:
+                self.amounts.append(amount)
+            except OverflowError:
+                self.amounts = list(self.amounts)
+                self.amounts.append(amount)
+            self.ops.append(op)
+            self.positions.append(position)
+            if op == BUY:
+                self.buys += amount
+            else:
+                self.sells += amount
+
+    def __len__(self) -> int:
+        """Return the number of parsed transactions."""
+        return len(self.ops)
+
+    @property
+    def net(self) -> int:
+        """Return the net flow of the batch."""
+        return self.buys - self.sells
+
+
 class TransactionStream(DataStream):
     """Stream handler for financial transaction data."""
 
+    routes: Tuple[str, ...] = tuple(OP_CODES)
+    filter_fields: Tuple[str, ...] = ("op", "amount")
+    named_filters: Dict[str, str] = {"large": "amount > 100"}
+
     def __init__(self, stream_id: str) -> None:
         """Initialize the transaction stream."""
         super().__init__(stream_id)
         self.count: int = 0
+        self.total_buys: int = 0
+        self.total_sells: int = 0
+        self.transactions: int = 0
         self.stream_type: str = "Financial Data"
         print("Initializing Transaction Stream...")
         print(f"Stream ID: {self.stream_id}, Type: {self.stream_type}")
 
     def process_batch(self, data_batch: List[Any]) -> str:
         """Process a batch of financial transactions."""
-        batch_size = len(data_batch)
+        return self.process_columns(TransactionColumns(data_batch))
+
+    def process_columns(self, columns: TransactionColumns) -> str:
+        """
+        Process a batch that was already parsed into columns.
+        Pass the same columns to filter_columns to filter the batch
+        without parsing it again.
+        """
+        batch_size = columns.size
         self.count += batch_size
-        buys = sum(
-            int(item.split(":")[1])
-            for item in data_batch
-            if item.startswith("buy")
-        )
-        sells = sum(
-            int(item.split(":")[1])
-            for item in data_batch
-            if item.startswith("sell")
-        )
-        net = buys - sells
+        self.total_buys += columns.buys
+        self.total_sells += columns.sells
+        self.transactions += len(columns)
+        net = columns.net
         net_str = f"+{net}" if net >= 0 else str(net)
         return (
             f"Transaction analysis: {batch_size} operations, "
             f"net flow: {net_str} units"
         )
 
-    def filter_data(
+    def filter_rows(
+        self, data_batch: List[Any]
+    ) -> Tuple[Iterable[int], Iterable[Tuple[Any, ...]]]:
+        """Return (op, amount) rows straight from the batch columns."""
+        return self.column_rows(TransactionColumns(data_batch))
+
+    @staticmethod
+    def column_rows(
+        columns: TransactionColumns
+    ) -> Tuple[Iterable[int], Iterable[Tuple[Any, ...]]]:
+        """Return the positions and (op, amount) rows of parsed columns."""
+        return columns.positions, zip(
+            map(OP_NAMES.__getitem__, columns.ops), columns.amounts)
+
+    def filter_columns(
         self,
         data_batch: List[Any],
+        columns: TransactionColumns,
         criteria: Optional[str] = None
     ) -> List[Any]:
         """
-        Filter transaction data by criteria.
+        Filter a batch using columns already parsed from it.
+        columns must come from this very batch, unchanged since.
         """
-        if criteria == "large":
-            return [
-                item for item in data_batch
-                if (item.startswith("buy") or item.startswith("sell"))
-                and int(item.split(":")[1]) > 100
-            ]
-        return data_batch
+        if criteria is None:
+            return data_batch
+        positions, rows = self.column_rows(columns)
+        return self.filter_parsed(data_batch, criteria, positions, rows)
 
     def get_stats(self) -> Dict[str, Union[str, int, float]]:
         """Return transaction stream statistics."""
         return {
             "stream_id": self.stream_id,
-            "total_operations": self.count
+            "total_operations": self.count,
+            "transactions": self.transactions,
+            "total_buys": self.total_buys,
+            "total_sells": self.total_sells,
+            "net_flow": self.total_buys - self.total_sells
+        }
+
+
+class EventWindow:
+    """
+    Sliding or tumbling window of event and error counts.
+    The window spans size units split into buckets of slide units, kept
+    in a ring buffer with running totals, so recording an event and
+    advancing the window are O(1). Units are events, or seconds when a
+    clock is given; slide == size gives a tumbling window.
+    """
+
+    def __init__(
+        self,
+        size: float,
+        slide: Optional[float] = None,
+        clock: Optional[Callable[[], float]] = None,
+        history: int = 16
+    ) -> None:
+        """Initialize an empty window."""
+        slide = size if slide is None else slide
+        if slide <= 0 or size < slide:
+            raise ValueError("window needs 0 < slide <= size")
+        buckets: int = round(size / slide)
+        if clock is None and (size != int(size) or slide != int(slide)
+                              or buckets * slide != size):
+            raise ValueError(
+                "count windows need integer sizes with size % slide == 0")
+        self.size: float = size
+        self.slide: float = slide
+        self.clock: Optional[Callable[[], float]] = clock
+        self.buckets: int = buckets
+        self.events: array[int] = array("q", bytes(8 * buckets))
+        self.errors: array[int] = array("q", bytes(8 * buckets))
+        self.window_events: int = 0
+        self.window_errors: int = 0
+        self.ticks: int = 0
+        self.current: int = self._position()
+        self.windows: int = 0
+        self.peak_error_rate: float = 0.0
+        self.recent: deque[float] = deque(maxlen=history)
+
+    def _position(self) -> int:
+        """Return the absolute bucket index for the next event."""
+        if self.clock is None:
+            return int(self.ticks // self.slide)
+        return int(self.clock() // self.slide)
+
+    def _advance(self, position: int) -> None:
+        """
+        Close the current window and evict the buckets that fall out
+        of it. At most one full turn of the ring is cleared, however
+        long the gap since the last event.
+        """
+        if self.window_events:
+            rate: float = self.window_errors / self.window_events
+            self.windows += 1
+            self.recent.append(rate)
+            if rate > self.peak_error_rate:
+                self.peak_error_rate = rate
+        steps: int = min(position - self.current, self.buckets)
+        for step in range(1, steps + 1):
+            slot: int = (self.current + step) % self.buckets
+            self.window_events -= self.events[slot]
+            self.window_errors -= self.errors[slot]
+            self.events[slot] = 0
+            self.errors[slot] = 0
+        self.current = position
+
+    def record(self, is_error: bool) -> None:
+        """Add one event to the window."""
+        position: int = self._position()
+        if position > self.current:
+            self._advance(position)
+        slot: int = self.current % self.buckets
+        self.events[slot] += 1
+        self.window_events += 1
+        if is_error:
+            self.errors[slot] += 1
+            self.window_errors += 1
+        self.ticks += 1
+
+    def record_many(self, events: List[Any], error: Any = "error") -> int:
+        """
+        Add a batch of events, those equal to error counting as errors,
+        and return how many errors it held. The batch is folded into
+        buckets in bulk: count windows cut it at bucket boundaries, one
+        slice and count() per bucket, and clock windows read the clock
+        once for the whole batch.
+        """
+        total: int = len(events)
+        found: int = 0
+        start: int = 0
+        while start < total:
+            position: int = self._position()
+            if position > self.current:
+                self._advance(position)
+            stop: int = (total if self.clock is not None
+                         else start + int(self.slide
+                                          - self.ticks % self.slide))
+            chunk: List[Any] = (events[start:stop]
+                                if start or stop < total else events)
+            count: int = len(chunk)
+            errors: int = chunk.count(error)
+            slot: int = self.current % self.buckets
+            self.events[slot] += count
+            self.window_events += count
+            self.errors[slot] += errors
+            self.window_errors += errors
+            self.ticks += count
+            found += errors
+            start = stop
+        return found
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return the current window and the error rates of past ones."""
+        if self.clock is not None:
+            position: int = self._position()
+            if position > self.current:
+                self._advance(position)
+        return {
+            "window_events": self.window_events,
+            "window_errors": self.window_errors,
+            "error_rate": (self.window_errors / self.window_events
+                           if self.window_events else 0.0),
+            "windows_closed": self.windows,
+            "peak_error_rate": self.peak_error_rate,
+            "recent_error_rates": list(self.recent)
         }
 
 
 class EventStream(DataStream):
     """Stream handler for system event data."""
 
-    def __init__(self, stream_id: str) -> None:
-        """Initialize the event stream."""
+    routes: Tuple[str, ...] = ("login", "logout", "error", CATCH_ALL)
+    filter_fields: Tuple[str, ...] = ("event", "value")
+
+    def __init__(
+        self,
+        stream_id: str,
+        window: float = 100,
+        slide: Optional[float] = None,
+        clock: Optional[Callable[[], float]] = None
+    ) -> None:
+        """
+        Initialize the event stream.
+        Events are aggregated over a window of the last window events
+        (or seconds of clock), advancing every slide units.
+        """
         super().__init__(stream_id)
         self.total_events: int = 0
         self.total_errors: int = 0
+        self.window: EventWindow = EventWindow(window, slide, clock)
         self.stream_type: str = "System Events"
         print("Initializing Event Stream...")
         print(f"Stream ID: {self.stream_id}, Type: {self.stream_type}")
@@ -141,38 +784,147 @@ class EventStream(DataStream):
         """Process a batch of system events."""
         batch_size = len(data_batch)
         self.total_events += batch_size
-        self.total_errors += len(
-            [item for item in data_batch if item == "error"]
-        )
+        self.total_errors += self.window.record_many(data_batch)
         return (
             f"Event analysis: {batch_size} events, "
             f"{self.total_errors} error detected"
         )
 
-    def get_stats(self) -> Dict[str, Union[str, int, float]]:
-        """Return event stream statistics."""
+    def get_stats(self) -> Dict[str, Any]:
+        """Return event stream statistics, including window error rates."""
         return {
             "stream_id": self.stream_id,
             "total_events": self.total_events,
-            "total_errors": self.total_errors
+            "total_errors": self.total_errors,
+            "window": self.window.snapshot()
         }
 
 
+def _run_stream(
+    stream: DataStream, data_batch: List[Any]
+) -> Tuple[str, DataStream]:
+    """
+    Worker entry point for pool execution. Returns the batch result
+    together with the stream, whose state a worker process updated on
+    its own copy.
+    """
+    return stream.process_batch(data_batch), stream
+
+
 class StreamProcessor:
-    """Manages and processes multiple data streams polymorphically."""
+    """
+    Manages and processes multiple data streams polymorphically. The
+    pooled executors keep one worker pool across calls; close it with
+    close() or by using the processor as a context manager.
+    """
+    EXECUTORS = ("serial", "thread", "process")
 
-    def __init__(self) -> None:
-        """Initialize the stream processor with an empty stream list."""
+    def __init__(
+        self,
+        executor: str = "serial",
+        max_workers: Optional[int] = None,
+        timeout: Optional[float] = None,
+        routing: bool = True
+    ) -> None:
+        """
+        Initialize the stream processor with an empty stream list.
+        executor selects how process_all fans out: "serial", "thread"
+        (I/O-bound streams) or "process" (CPU-bound streams). timeout
+        bounds how long each stream may take in the pooled modes; a
+        stream whose run timed out gets no new batch until that run has
+        finished. With routing, each stream only receives the records
+        matching its routes instead of the whole batch.
+        """
+        if executor not in self.EXECUTORS:
+            raise ValueError(f"Unknown executor: {executor}")
         self.streams: List[DataStream] = []
+        self.executor: str = executor
+        self.max_workers: Optional[int] = max_workers
+        self.timeout: Optional[float] = timeout
+        self.routing: bool = routing
+        self._index: Optional[Dict[str, Tuple[int, ...]]] = None
+        self._broadcast: Tuple[int, ...] = ()
+        self._fallback: Tuple[int, ...] = ()
+        self._pool: Optional[Executor] = None
+        self._pool_size: int = 0
+        self._running: Dict[int, Future[Tuple[str, DataStream]]] = {}
 
     def add_stream(self, stream: DataStream) -> None:
         """Add a stream to the processor."""
         self.streams.append(stream)
+        self._index = None
+
+    def _build_index(self) -> Dict[str, Tuple[int, ...]]:
+        """Map every routed prefix to the positions of its streams."""
+        index: Dict[str, List[int]] = {}
+        broadcast: List[int] = []
+        fallback: List[int] = []
+        for position, stream in enumerate(self.streams):
+            if not stream.routes:
+                broadcast.append(position)
+            for prefix in stream.routes:
+                if prefix == CATCH_ALL:
+                    fallback.append(position)
+                else:
+                    index.setdefault(prefix, []).append(position)
+        self._broadcast = tuple(broadcast)
+        self._fallback = tuple(fallback)
+        self._index = {
+            prefix: tuple(positions) for prefix, positions in index.items()
+        }
+        return self._index
+
+    def split_batch(self, data_batch: List[Any]) -> List[List[Any]]:
+        """
+        Split a mixed batch into one slice per stream in a single pass.
+        Streams without routes get the whole batch; records matching no
+        route, non-string ones included, go to the CATCH_ALL streams.
+        """
+        index = self._index
+        if index is None:
+            index = self._build_index()
+        slices: List[List[Any]] = [[] for _ in self.streams]
+        for position in self._broadcast:
+            slices[position] = data_batch
+        targets: Dict[str, Tuple[Callable[[Any], None], ...]] = {
+            prefix: tuple(slices[position].append for position in positions)
+            for prefix, positions in index.items()
+        }
+        unrouted: Tuple[Callable[[Any], None], ...] = tuple(
+            slices[position].append for position in self._fallback)
+        lookup = targets.get
+        for item in data_batch:
+            if isinstance(item, str):
+                for append in lookup(item.partition(":")[0], unrouted):
+                    append(item)
+            else:
+                for append in unrouted:
+                    append(item)
+        return slices
 
     def process_all(self, data_batch: List[Any]) -> List[str]:
-        """Process a batch through all registered streams."""
+        """
+        Process a batch through all registered streams and return their
+        results in registration order.
+        """
+        batches: List[List[Any]] = (
+            self.split_batch(data_batch) if self.routing
+            else [data_batch] * len(self.streams))
+        if self.executor == "serial":
+            return self._process_serial(batches)
+        return self._process_parallel(batches)
+
+    def process_source(
+        self, source: Iterable[List[Any]]
+    ) -> Iterator[List[str]]:
+        """Process every micro-batch of a source through all streams."""
+        for data_batch in source:
+            yield self.process_all(data_batch)
+
+    def _process_serial(self, batches: List[List[Any]]) -> List[str]:
+        """Run each stream one after another on its batch."""
         results = []
-        for stream in self.streams:
+        for stream, data_batch in zip(self.streams, batches):
             try:
                 result: str = stream.process_batch(data_batch)
                 results.append(result)
@@ -182,6 +934,112 @@ class StreamProcessor:
                 )
         return results
 
+    def _get_pool(self) -> Executor:
+        """
+        Return the shared worker pool, creating it on first use. Without
+        an explicit max_workers the pool has one worker per stream, and
+        it is replaced when streams were added since it was created.
+        """
+        size: int = self.max_workers or max(1, len(self.streams))
+        if self._pool is not None and size > self._pool_size:
+            # Runs that timed out still finish on the old pool's workers.
+            self._pool.shutdown(wait=False)
+            self._pool = None
+        if self._pool is None:
+            if self.executor == "thread":
+                self._pool = ThreadPoolExecutor(
+                    max_workers=size, thread_name_prefix="stream")
+            else:
+                self._pool = ProcessPoolExecutor(max_workers=size)
+            self._pool_size = size
+        return self._pool
+
+    def close(self) -> None:
+        """Shut down the worker pool, waiting for runs still going."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+            self._pool = None
+        for position in list(self._running):
+            self._settle(position)
+
+    def _settle(self, position: int) -> None:
+        """
+        Forget the finished late run of a stream that timed out. Like a
+        thread run, a worker process run that completes late keeps its
+        effect: its copy of the stream state is copied back. Only its
+        result string is lost.
+        """
+        future: Future[Tuple[str, DataStream]] = self._running.pop(position)
+        if future.cancelled() or future.exception() is not None:
+            return
+        stream: DataStream = self.streams[position]
+        worked: DataStream = future.result()[1]
+        if worked is not stream:
+            vars(stream).update(vars(worked))
+
+    def __enter__(self) -> "StreamProcessor":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def _process_parallel(self, batches: List[List[Any]]) -> List[str]:
+        """
+        Hand every stream its batch at once on the thread or process
+        pool. A stream that misses its deadline is reported as an error
+        without holding back the others. Its run cannot be interrupted,
+        so it keeps the stream busy: the stream is skipped, not handed a
+        batch to process concurrently, until that run has finished.
+        Worker processes update copies of the streams, so their state
+        is copied back here, for late runs too once they finish.
+        """
+        pool: Executor = self._get_pool()
+        results: List[str] = []
+        futures: List[Optional[Future[Tuple[str, DataStream]]]] = []
+        for position, (stream, data_batch) in enumerate(
+                zip(self.streams, batches)):
+            running: Optional[Future[Tuple[str, DataStream]]] = (
+                self._running.get(position))
+            if running is not None:
+                if not running.done():
+                    futures.append(None)
+                    continue
+                self._settle(position)
+            futures.append(pool.submit(_run_stream, stream, data_batch))
+        deadline: Optional[float] = (
+            None if self.timeout is None
+            else time.monotonic() + self.timeout)
+        for position, (stream, future) in enumerate(
+                zip(self.streams, futures)):
+            if future is None:
+                results.append(
+                    f"Error processing stream {stream.stream_id}: "
+                    f"still running a timed out batch"
+                )
+                continue
+            remaining: Optional[float] = (
+                None if deadline is None
+                else max(0.0, deadline - time.monotonic()))
+            try:
+                result, worked = future.result(timeout=remaining)
+            except FutureTimeout:
+                if not future.cancel():
+                    self._running[position] = future
+                results.append(
+                    f"Error processing stream {stream.stream_id}: "
+                    f"timed out after {self.timeout}s"
+                )
+                continue
+            except Exception as e:
+                results.append(
+                    f"Error processing stream {stream.stream_id}: {e}"
+                )
+                continue
+            if worked is not stream:
+                vars(stream).update(vars(worked))
+            results.append(result)
+        return results
+
 
 if __name__ == "__main__":
     print("=== CODE NEXUS - POLYMORPHIC STREAM SYSTEM ===\n")
@@ -0,0 +1,474 @@
+import argparse
+import gc
+import io
+import math
+import os
+import random
+import tempfile
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from nexus_pipeline import (
+    BufferedReporter, ConsoleReporter, CSVAdapter, InputStage, JSONAdapter,
+    DICT_KIND, LIST_KIND, STR_KIND, NexusManager, OutputStage, PayloadKind,
+    PayloadRegistry, ProcessingPipeline, Record, Reporter, StreamAdapter,
+    TransformStage
+)
+
+
+class BenchPipeline(ProcessingPipeline):
+    """Bare pipeline whose stages are supplied by the benchmark."""
+    def process(self, data: Any) -> Any:
+        return self.run_stages(data)
+
+
+def make_sensor_records(count: int) -> List[Dict[str, Any]]:
+    """Builds a list of synthetic sensor dicts."""
+    return [
+        {"sensor": f"temp_{i % 64}", "value": 20.0 + i % 10, "unit": "C"}
+        for i in range(count)
+    ]
+
+
+def measure(func: Callable[[], Any], repeat: int = 5) -> float:
+    """
+    Returns the best wall time over several runs of func, with the
+    garbage collector paused as timeit does.
+    """
+    best: float = float("inf")
+    gc_enabled: bool = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            start: float = time.perf_counter()
+            func()
+            best = min(best, time.perf_counter() - start)
+    finally:
+        if gc_enabled:
+            gc.enable()
+    return best
+
+
+def bench_run_batch(count: int) -> None:
+    """Compares the per-record run_stages loop against run_batch."""
+    records: List[Dict[str, Any]] = make_sensor_records(count)
+    pipeline = JSONAdapter("BENCH_JSON")
+
+    def per_record() -> None:
+        run_stages = pipeline.run_stages
+        for record in records:
+            run_stages(record)
+
+    def batched() -> None:
+        pipeline.run_batch(records)
+
+    loop_time: float = measure(per_record)
+    batch_time: float = measure(batched)
+    print(f"run_stages loop : {count / loop_time:>12,.0f} records/sec")
+    print(f"run_batch       : {count / batch_time:>12,.0f} records/sec")
+    print(f"Speedup         : {loop_time / batch_time:.2f}x")
+
+
+def bench_reporting(count: int) -> None:
+    """Measures JSONAdapter.process throughput under each reporter."""
+    records: List[Dict[str, Any]] = make_sensor_records(count)
+    with open(os.devnull, "w") as devnull:
+        reporters: Dict[str, Optional[Reporter]] = {
+            "silent (default)": None,
+            "buffered": BufferedReporter(io.StringIO()),
+            "console (devnull)": ConsoleReporter(devnull),
+        }
+        for name, reporter in reporters.items():
+            adapter = JSONAdapter("BENCH_JSON", reporter)
+
+            def run() -> None:
+                process = adapter.process
+                for record in records:
+                    process(record)
+
+            elapsed: float = measure(run, repeat=3)
+            print(f"{name:<18}: {count / elapsed:>12,.0f} records/sec")
+
+
+def legacy_dict_stages(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Reproduces the former dict-spreading Input -> Transform path."""
+    validated: Dict[str, Any] = {"raw": data, "status": "valid",
+                                 "type": "dict"}
+    raw: Dict[str, Any] = validated["raw"]
+    return {
+        **validated,
+        "status": "transformed",
+        "keys": list(raw.keys()),
+        "size": len(raw),
+        "summary": f"Dict with {len(raw)} fields"
+    }
+
+
+def bytes_per_record(
+    func: Callable[[Any], Any], records: List[Any]
+) -> float:
+    """Traces memory retained by func's results, averaged per record."""
+    tracemalloc.start()
+    try:
+        before: int = tracemalloc.get_traced_memory()[0]
+        results: List[Any] = [func(record) for record in records]
+        after: int = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del results
+    return (after - before) / len(records)
+
+
+def bench_allocations(count: int) -> None:
+    """Compares per-record allocations of dict copies and the envelope."""
+    records: List[Dict[str, Any]] = make_sensor_records(count)
+    input_stage = InputStage()
+    transform_stage = TransformStage()
+
+    def envelope(data: Dict[str, Any]) -> Any:
+        return transform_stage.process(input_stage.process(data))
+
+    legacy: float = bytes_per_record(legacy_dict_stages, records)
+    slotted: float = bytes_per_record(envelope, records)
+    print(f"dict spreading  : {legacy:>8.1f} bytes/record")
+    print(f"Record envelope : {slotted:>8.1f} bytes/record")
+
+
+def bench_csv_file(rows: int) -> None:
+    """Reports CSVAdapter.process_file ingestion throughput in MB/s."""
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path: str = os.path.join(tmp_dir, "sensors.csv")
+        with open(path, "w", newline="") as file:
+            file.write("sensor,value,unit,timestamp\n")
+            for i in range(rows):
+                file.write(f"temp_{i % 64},{20 + i % 10}.5,C,{i}\n")
+        size_mb: float = os.path.getsize(path) / (1024 * 1024)
+        adapter = CSVAdapter("BENCH_CSV")
+
+        def run() -> None:
+            for _ in adapter.process_file(path):
+                pass
+
+        elapsed: float = measure(run, repeat=3)
+    print(f"File size       : {size_mb:.1f} MB ({rows} rows)")
+    print(f"Throughput      : {size_mb / elapsed:.1f} MB/s "
+          f"({rows / elapsed:,.0f} rows/sec)")
+
+
+def legacy_run_stages(pipeline: ProcessingPipeline, data: Any) -> Any:
+    """Reproduces run_stages as it was before the instrumentation check."""
+    result: Any = data
+    try:
+        for stage in pipeline.stages:
+            result = stage.process(result)
+            pipeline.stats["stages_run"] += 1
+    except Exception as e:
+        pipeline.stats["errors"] += 1
+        return f"[ERROR] Stage failed: {str(e)}"
+    return result
+
+
+def bench_instrumentation(count: int) -> None:
+    """Measures run_stages overhead with instrumentation off and on."""
+    records: List[Dict[str, Any]] = make_sensor_records(count)
+    pipeline = JSONAdapter("BENCH_JSON")
+
+    def legacy() -> None:
+        for record in records:
+            legacy_run_stages(pipeline, record)
+
+    def current() -> None:
+        run_stages = pipeline.run_stages
+        for record in records:
+            run_stages(record)
+
+    base_time: float = measure(legacy)
+    off_time: float = measure(current)
+    pipeline.enable_instrumentation()
+    on_time: float = measure(current)
+    pipeline.disable_instrumentation()
+    print(f"Plain stage loop: {count / base_time:>12,.0f} records/sec")
+    print(f"Hooks off       : {count / off_time:>12,.0f} records/sec "
+          f"({(off_time / base_time - 1) * 100:+.1f}%)")
+    print(f"Hooks on        : {count / on_time:>12,.0f} records/sec "
+          f"({(on_time / base_time - 1) * 100:+.1f}%)")
+
+
+def bench_sealed_plans(count: int) -> None:
+    """Compares the stage loop with the sealed plan for 1, 3, 10 stages."""
+    records: List[Dict[str, Any]] = make_sensor_records(count)
+    layouts: Dict[int, List[Any]] = {
+        1: [InputStage()],
+        3: [InputStage(), TransformStage(), OutputStage()],
+        10: [InputStage()] + [TransformStage() for _ in range(8)]
+        + [OutputStage()],
+    }
+    for size, stages in layouts.items():
+        pipeline = BenchPipeline(f"BENCH_{size}")
+        for stage in stages:
+            pipeline.add_stage(stage)
+        pipeline.seal()
+
+        def loop() -> None:
+            for record in records:
+                legacy_run_stages(pipeline, record)
+
+        def sealed() -> None:
+            run_stages = pipeline.run_stages
+            for record in records:
+                run_stages(record)
+
+        loop_time: float = measure(loop)
+        sealed_time: float = measure(sealed)
+        print(f"{size:>2} stages: loop {count / loop_time:>10,.0f}/s, "
+              f"sealed {count / sealed_time:>10,.0f}/s "
+              f"({loop_time / sealed_time:.2f}x)")
+
+
+def bench_result_cache(count: int, distinct: int, words: int) -> None:
+    """
+    Compares run_stages on repeated text payloads with and without the
+    result cache.
+    """
+    pipeline = JSONAdapter("BENCH_TEXT")
+    texts: List[str] = [
+        " ".join(f"sensor_{i}_reading_{j}" for j in range(words))
+        for i in range(distinct)
+    ]
+    payloads: List[str] = [texts[i % distinct] for i in range(count)]
+
+    def run() -> None:
+        run_stages = pipeline.run_stages
+        for payload in payloads:
+            run_stages(payload)
+
+    plain_time: float = measure(run, repeat=3)
+    cache = pipeline.enable_cache()
+    cached_time: float = measure(run, repeat=3)
+    hit_rate: float = cache.hits / (cache.hits + cache.misses)
+    print(f"No cache        : {count / plain_time:>12,.0f} records/sec")
+    print(f"Result cache    : {count / cached_time:>12,.0f} records/sec "
+          f"({hit_rate:.1%} hits)")
+
+
+def make_json_workload(count: int, rng: random.Random) -> List[Any]:
+    """Random sensor readings as JSON-like dicts."""
+    return [
+        {"sensor": f"temp_{rng.randrange(64)}",
+         "value": round(rng.uniform(15.0, 30.0), 1), "unit": "C"}
+        for _ in range(count)
+    ]
+
+
+def make_csv_workload(count: int, rng: random.Random) -> List[Any]:
+    """Random comma-separated activity lines of 3 to 8 fields."""
+    fields: List[str] = [
+        "user", "action", "timestamp", "session", "device", "region",
+        "status", "latency", "bytes", "agent"
+    ]
+    return [",".join(rng.sample(fields, rng.randint(3, 8)))
+            for _ in range(count)]
+
+
+def make_stream_workload(
+    count: int, rng: random.Random, window: int = 64
+) -> List[Any]:
+    """Random windows of float sensor readings."""
+    return [
+        [rng.gauss(22.0, 1.5) for _ in range(window)]
+        for _ in range(count)
+    ]
+
+
+def percentile(ordered: List[float], q: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not ordered:
+        return 0.0
+    rank: int = max(1, math.ceil(len(ordered) * q / 100))
+    return ordered[rank - 1]
+
+
+def profile_workload(
+    func: Callable[[Any], Any], payloads: List[Any]
+) -> Dict[str, float]:
+    """
+    Runs func over every payload and returns records/sec, per-call
+    latency percentiles (microseconds) and peak traced memory (KiB).
+    The memory pass is separate, so tracing does not skew timings.
+    """
+    latencies: List[float] = []
+    clock = time.perf_counter
+    gc.collect()
+    start_all: float = clock()
+    for payload in payloads:
+        start: float = clock()
+        func(payload)
+        latencies.append(clock() - start)
+    elapsed: float = clock() - start_all
+    latencies.sort()
+    tracemalloc.start()
+    try:
+        for payload in payloads:
+            func(payload)
+        peak: int = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return {
+        "records_per_sec": len(payloads) / elapsed,
+        "p50_us": percentile(latencies, 50) * 1e6,
+        "p95_us": percentile(latencies, 95) * 1e6,
+        "p99_us": percentile(latencies, 99) * 1e6,
+        "peak_kib": peak / 1024
+    }
+
+
+def print_profile(name: str, profile: Dict[str, float]) -> None:
+    """Prints one row of the workload table."""
+    print(f"{name:<16}{profile['records_per_sec']:>12,.0f}"
+          f"{profile['p50_us']:>10.1f}{profile['p95_us']:>10.1f}"
+          f"{profile['p99_us']:>10.1f}{profile['peak_kib']:>12,.1f}")
+
+
+def bench_workloads(count: int, seed: int) -> None:
+    """
+    Profiles every adapter on its synthetic workload, then the three
+    adapters chained through NexusManager.chain_pipelines.
+    """
+    rng: random.Random = random.Random(seed)
+    json_payloads: List[Any] = make_json_workload(count, rng)
+    cases: List[Tuple[str, Callable[[Any], Any], List[Any]]] = [
+        ("JSONAdapter", JSONAdapter("BENCH_JSON").process, json_payloads),
+        ("CSVAdapter", CSVAdapter("BENCH_CSV").process,
+         make_csv_workload(count, rng)),
+        ("StreamAdapter", StreamAdapter("BENCH_STREAM").process,
+         make_stream_workload(max(1, count // 10), rng)),
+    ]
+    manager = NexusManager()
+    manager.add_pipeline(JSONAdapter("CHAIN_JSON"))
+    manager.add_pipeline(CSVAdapter("CHAIN_CSV"))
+    manager.add_pipeline(StreamAdapter("CHAIN_STREAM"))
+    cases.append(
+        ("chain_pipelines", manager.chain_pipelines, json_payloads))
+    print(f"{'workload':<16}{'records/s':>12}{'p50 us':>10}"
+          f"{'p95 us':>10}{'p99 us':>10}{'peak KiB':>12}")
+    for name, func, payloads in cases:
+        print_profile(name, profile_workload(func, payloads))
+
+
+def make_sized_kind(name: str) -> PayloadKind:
+    """Generic kind for the dispatch benchmark's extra payload types."""
+    def validate(record: Record) -> None:
+        record.size = len(str(record.raw))
+
+    def transform(record: Record) -> None:
+        record.summary = f"{name} of size {record.size}"
+
+    def format(data: Any) -> str:
+        return f"[OUTPUT] {data.get('summary')}"
+
+    return PayloadKind(name, validate, transform, format)
+
+
+def bench_dispatch(count: int) -> None:
+    """
+    Compares an isinstance if-elif chain with the PayloadRegistry table
+    for 13 payload types, resolving the handler for every payload.
+    """
+    samples: List[Any] = [
+        {"a": 1}, "text", [1, 2], 7, 2.5, b"raw", (1, 2), {1, 2},
+        frozenset({3}), 1j, bytearray(b"xy"), range(3), True
+    ]
+    kinds: Dict[type, PayloadKind] = {
+        dict: DICT_KIND, str: STR_KIND, list: LIST_KIND}
+    registry = PayloadRegistry()
+    for sample in samples:
+        data_type: type = type(sample)
+        kind: PayloadKind = kinds.get(data_type) or make_sized_kind(
+            data_type.__name__)
+        kinds[data_type] = kind
+        registry.register(data_type, kind)
+    order: Tuple[type, ...] = tuple(kinds)
+    payloads: List[Any] = [samples[i % len(samples)] for i in range(count)]
+
+    def chain() -> None:
+        for payload in payloads:
+            for data_type in order:
+                if isinstance(payload, data_type):
+                    kinds[data_type]
+                    break
+
+    def table() -> None:
+        resolve = registry.resolve
+        for payload in payloads:
+            resolve(type(payload))
+
+    input_stage = InputStage(registry)
+
+    def stage() -> None:
+        process = input_stage.process
+        for payload in payloads:
+            process(payload)
+
+    chain_time: float = measure(chain)
+    table_time: float = measure(table)
+    stage_time: float = measure(stage)
+    print(f"Registered types: {len(registry.types)}")
+    print(f"isinstance chain: {count / chain_time:>12,.0f} lookups/sec")
+    print(f"dispatch table  : {count / table_time:>12,.0f} lookups/sec "
+          f"({chain_time / table_time:.2f}x)")
+    print(f"InputStage      : {count / stage_time:>12,.0f} records/sec")
+
+
+def main() -> None:
+    """Main entry point for the Code Nexus benchmark runner."""
+    parser = argparse.ArgumentParser(
+        description="Code Nexus pipeline benchmark runner")
+    parser.add_argument(
+        "--records", type=int, default=100_000,
+        help="base workload size (default: 100000)")
+    parser.add_argument(
+        "--seed", type=int, default=42,
+        help="seed for the synthetic workloads (default: 42)")
+    parser.add_argument(
+        "--only", nargs="+", metavar="SECTION",
+        help="run only the named sections")
+    args = parser.parse_args()
+    n: int = max(10, args.records)
+
+    sections: Dict[str, Tuple[str, Callable[[], None]]] = {
+        "workloads": (f"Adapter Workloads ({n} records)",
+                      lambda: bench_workloads(n, args.seed)),
+        "batch": (f"Batch vs Per-Record Execution ({n} records)",
+                  lambda: bench_run_batch(n)),
+        "reporting": (f"Adapter Reporting Overhead ({n // 2} records)",
+                      lambda: bench_reporting(n // 2)),
+        "allocations": (
+            f"Input -> Transform Allocations ({n // 10} records)",
+            lambda: bench_allocations(n // 10)),
+        "csv": ("CSV File Ingestion", lambda: bench_csv_file(n * 2)),
+        "instrumentation": (
+            f"Stage Instrumentation Overhead ({n} records)",
+            lambda: bench_instrumentation(n)),
+        "sealed": (f"Sealed Stage Plans ({n} records)",
+                   lambda: bench_sealed_plans(n)),
+        "dispatch": (f"Type Dispatch, 13 payload types ({n} records)",
+                     lambda: bench_dispatch(n)),
+        "cache": (f"Result Cache ({n // 5} payloads, 200 distinct texts)",
+                  lambda: bench_result_cache(n // 5, 200, 100)),
+    }
+    selected: List[str] = args.only or list(sections)
+    unknown: List[str] = [name for name in selected if name not in sections]
+    if unknown:
+        parser.error(f"unknown sections: {', '.join(unknown)} "
+                     f"(choose from {', '.join(sections)})")
+
+    print("=== CODE NEXUS - PIPELINE BENCHMARK ===")
+    for name in selected:
+        title, run = sections[name]
+        print(f"\n=== {title} ===")
+        run()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,177 +1,1213 @@
-from typing import Any, List, Dict, Protocol, Union, Optional
+import asyncio
+import cProfile
+import csv
+import hashlib
+import inspect
+import json
+import math
+import multiprocessing
+import os
+import pickle
+import queue
+import sys
+import threading
+import time
+from typing import (
+    Any, AsyncIterable, BinaryIO, Callable, Hashable, Iterable, Iterator,
+    List, Dict, Protocol, Sequence, Union, Optional, TextIO, Tuple
+)
 from abc import ABC, abstractmethod
-from collections import defaultdict
+from collections import OrderedDict, defaultdict, deque
+from concurrent.futures import (
+    Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+)
+from array import array
+from bisect import bisect_left
+
+try:
+    import numpy
+except ImportError:
+    np: Any = None
+else:
+    np = numpy
 
 
 class ProcessingStage(Protocol):
-    """Protocol defining the interface for a single processing stage."""
+    """
+    Protocol defining the interface for a single processing stage.
+    Stages may also expose process_batch(list) to handle whole chunks.
+    """
     def process(self, data: Any) -> Any:
         pass
 
 
+class AsyncProcessingStage(Protocol):
+    """Protocol for a stage that awaits I/O instead of blocking on it."""
+    async def process(self, data: Any) -> Any:
+        pass
+
+
+class Reporter(Protocol):
+    """
+    Protocol for a sink receiving progress messages from adapters.
+    Adapters skip building messages entirely when enabled is False.
+    """
+    enabled: bool
+
+    def report(self, pipeline_id: str, message: str) -> None:
+        pass
+
+
+class NullReporter:
+    """Silent reporter used by default on the production hot path."""
+    enabled: bool = False
+
+    def report(self, pipeline_id: str, message: str) -> None:
+        pass
+
+
+class ConsoleReporter:
+    """Writes every message straight to a text stream (stdout default)."""
+    enabled: bool = True
+
+    def __init__(self, stream: Optional[TextIO] = None) -> None:
+        """Binds the reporter to a stream, resolved lazily if omitted."""
+        self.stream: Optional[TextIO] = stream
+
+    def report(self, pipeline_id: str, message: str) -> None:
+        print(message, file=self.stream or sys.stdout)
+
+
+class BufferedReporter:
+    """
+    Collects messages in memory and writes them in one call once
+    capacity is reached or flush() is invoked.
+    """
+    enabled: bool = True
+
+    def __init__(
+        self, stream: Optional[TextIO] = None, capacity: int = 1000
+    ) -> None:
+        """Configures the target stream and the buffer capacity."""
+        self.stream: Optional[TextIO] = stream
+        self.capacity: int = capacity
+        self.buffer: List[Tuple[str, str]] = []
+
+    def report(self, pipeline_id: str, message: str) -> None:
+        self.buffer.append((pipeline_id, message))
+        if len(self.buffer) >= self.capacity:
+            self.flush()
+
+    def flush(self) -> None:
+        """Writes all pending messages and empties the buffer."""
+        if not self.buffer:
+            return
+        stream: TextIO = self.stream or sys.stdout
+        stream.write("".join(f"{msg}\n" for _, msg in self.buffer))
+        stream.flush()
+        self.buffer.clear()
+
+
+class BackgroundReporter:
+    """
+    Hands messages to a daemon thread that performs the actual write,
+    so terminal or file I/O never blocks the processing thread.
+    """
+    enabled: bool = True
+
+    def __init__(self, stream: Optional[TextIO] = None) -> None:
+        """Starts the writer thread bound to the given stream."""
+        self.stream: Optional[TextIO] = stream
+        self._queue: queue.SimpleQueue[Optional[Tuple[str, str]]] = (
+            queue.SimpleQueue())
+        self._thread: threading.Thread = threading.Thread(
+            target=self._drain, daemon=True)
+        self._thread.start()
+
+    def report(self, pipeline_id: str, message: str) -> None:
+        self._queue.put((pipeline_id, message))
+
+    def _drain(self) -> None:
+        """Writer loop; a None entry stops the thread."""
+        while True:
+            item: Optional[Tuple[str, str]] = self._queue.get()
+            if item is None:
+                return
+            print(item[1], file=self.stream or sys.stdout)
+
+    def close(self) -> None:
+        """Writes every queued message and stops the writer thread."""
+        self._queue.put(None)
+        self._thread.join()
+
+
+class Record:
+    """
+    Compact envelope carried through the stages. Stages annotate it in
+    place instead of rebuilding a dict per step; dict-style get() and
+    item access keep OutputStage and existing callers working.
+    """
+    __slots__ = (
+        "raw", "status", "type", "error", "count", "keys", "size",
+        "words", "word_count", "char_count", "summary", "meta"
+    )
+    raw: Any
+    status: str
+    type: str
+    error: str
+    count: int
+    keys: List[str]
+    size: int
+    words: List[str]
+    word_count: int
+    char_count: int
+    summary: str
+    meta: Dict[str, Any]
+
+    def __init__(
+        self, raw: Any, status: str = "valid", type: Optional[str] = None
+    ) -> None:
+        """Wraps a raw payload without copying it."""
+        self.raw = raw
+        self.status = status
+        if type is not None:
+            self.type = type
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Record":
+        """Builds an envelope from a legacy stage dictionary."""
+        record: Record = cls(data.get("raw"), data.get("status", "valid"))
+        for key in cls.__slots__:
+            if key in data:
+                setattr(record, key, data[key])
+        return record
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Returns an annotation, or default when it was never set."""
+        return getattr(self, key, default)
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def copy(self) -> "Record":
+        """Shallow copy for branches that must annotate independently."""
+        clone: Record = Record.__new__(Record)
+        for key in self.__slots__:
+            if hasattr(self, key):
+                setattr(clone, key, getattr(self, key))
+        return clone
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Returns the annotations that have been set as a dictionary."""
+        return {
+            key: getattr(self, key)
+            for key in self.__slots__ if hasattr(self, key)
+        }
+
+    def __repr__(self) -> str:
+        return f"Record({self.to_dict()})"
+
+
+class PayloadKind:
+    """
+    Handlers for one kind of payload: validate checks a fresh Record
+    (raising ValueError/TypeError), transform annotates it in place and
+    format renders the final report. Annotations that have no Record
+    slot of their own go in record.meta.
+    """
+    __slots__ = ("name", "validate", "transform", "format")
+
+    def __init__(
+        self,
+        name: str,
+        validate: Callable[[Record], None],
+        transform: Callable[[Record], None],
+        format: Callable[[Any], str]
+    ) -> None:
+        """Bundles the three stage handlers under a kind name."""
+        self.name: str = name
+        self.validate: Callable[[Record], None] = validate
+        self.transform: Callable[[Record], None] = transform
+        self.format: Callable[[Any], str] = format
+
+
+class PayloadRegistry:
+    """
+    Dispatch table from payload types to PayloadKind handlers. A
+    concrete type is resolved through its MRO once and cached, so each
+    record costs a single dict lookup; registering clears the cache.
+    """
+    def __init__(self) -> None:
+        """Starts with no registered kinds."""
+        self.kinds: Dict[str, PayloadKind] = {}
+        self.types: Dict[type, PayloadKind] = {}
+        self.resolved: Dict[type, Optional[PayloadKind]] = {}
+
+    def register(self, data_type: type, kind: PayloadKind) -> None:
+        """Routes payloads of data_type (and subclasses) to kind."""
+        self.kinds[kind.name] = kind
+        self.types[data_type] = kind
+        self.resolved.clear()
+
+    def resolve(self, data_type: type) -> Optional[PayloadKind]:
+        """Returns the kind handling data_type, or None."""
+        try:
+            return self.resolved[data_type]
+        except KeyError:
+            pass
+        kind: Optional[PayloadKind] = next(
+            (self.types[base] for base in data_type.__mro__
+             if base in self.types), None)
+        self.resolved[data_type] = kind
+        return kind
+
+
+def _validate_dict(record: Record) -> None:
+    if not record.raw:
+        raise ValueError("Empty dict received")
+
+
+def _transform_dict(record: Record) -> None:
+    raw: Dict[str, Any] = record.raw
+    record.keys = list(raw.keys())
+    record.size = len(raw)
+    record.summary = f"Dict with {len(raw)} fields"
+
+
+def _format_dict(data: Any) -> str:
+    keys: List[str] = data.get("keys", [])
+    return (
+        f"[OUTPUT] Dict processed successfully\n"
+        f"  Summary : {data.get('summary', 'No summary available')}\n"
+        f"  Fields  : {', '.join(keys)}\n"
+        f"  Size    : {data.get('size', 0)} fields"
+    )
+
+
+def _validate_str(record: Record) -> None:
+    record.raw = record.raw.strip()
+    if not record.raw:
+        raise ValueError("Empty string received")
+
+
+def _transform_str(record: Record) -> None:
+    words: List[str] = record.raw.split()
+    record.words = words
+    record.word_count = len(words)
+    record.char_count = len(record.raw)
+    record.summary = f"Text with {len(words)} words"
+
+
+def _format_str(data: Any) -> str:
+    return (
+        f"[OUTPUT] Text processed successfully\n"
+        f"  Summary : {data.get('summary', 'No summary available')}\n"
+        f"  Words   : {data.get('word_count', 0)}\n"
+        f"  Chars   : {data.get('char_count', 0)}"
+    )
+
+
+def _validate_list(record: Record) -> None:
+    if not record.raw:
+        raise ValueError("Empty list received")
+    record.count = len(record.raw)
+
+
+def _transform_list(record: Record) -> None:
+    record.count = len(record.raw)
+    record.summary = f"List with {len(record.raw)} items"
+
+
+def _format_list(data: Any) -> str:
+    return (
+        f"[OUTPUT] List processed successfully\n"
+        f"  Summary : {data.get('summary', 'No summary available')}\n"
+        f"  Items   : {data.get('count', 0)}"
+    )
+
+
+DICT_KIND: PayloadKind = PayloadKind(
+    "dict", _validate_dict, _transform_dict, _format_dict)
+STR_KIND: PayloadKind = PayloadKind(
+    "str", _validate_str, _transform_str, _format_str)
+LIST_KIND: PayloadKind = PayloadKind(
+    "list", _validate_list, _transform_list, _format_list)
+
+DEFAULT_REGISTRY: PayloadRegistry = PayloadRegistry()
+DEFAULT_REGISTRY.register(dict, DICT_KIND)
+DEFAULT_REGISTRY.register(str, STR_KIND)
+DEFAULT_REGISTRY.register(list, LIST_KIND)
+
+
 class InputStage:
     """
     Validates and categorizes incoming raw
-    data into a structured dictionary.
+    data into a structured record envelope.
+    Payload types are looked up in a PayloadRegistry.
     """
 
-    def process(self, data: Any) -> Dict[str, Any]:
+    def __init__(self, registry: Optional[PayloadRegistry] = None) -> None:
+        """Uses DEFAULT_REGISTRY unless another registry is given."""
+        self.registry: PayloadRegistry = registry or DEFAULT_REGISTRY
+
+    def process(self, data: Any) -> Record:
+        data_type: type = type(data)
+        kind: Optional[PayloadKind] = self.registry.resolved.get(data_type)
+        if kind is None:
+            kind = self.registry.resolve(data_type)
+        if kind is None:
+            record: Record = Record(data, "invalid")
+            record.error = f"Unsupported data type: {data_type}"
+            return record
+        record = Record(data, "valid", kind.name)
         try:
-            if isinstance(data, dict):
-                if not data:
-                    raise ValueError("Empty dict received")
-                return {
-                    "raw": data,
-                    "status": "valid",
-                    "type": "dict"
-                }
-            elif isinstance(data, str):
-                if not data.strip():
-                    raise ValueError("Empty string received")
-                return {
-                    "raw": data.strip(),
-                    "status": "valid",
-                    "type": "str"
-                }
-            elif isinstance(data, list):
-                if not data:
-                    raise ValueError("Empty list received")
-                return {
-                    "raw": data,
-                    "status": "valid",
-                    "type": "list",
-                    "count": len(data)
-                }
-            else:
-                raise TypeError(f"Unsupported data type: {type(data)}")
+            kind.validate(record)
         except (ValueError, TypeError) as e:
-            return {
-                "raw": data,
-                "status": "invalid",
-                "error": str(e)
-            }
+            record.status = "invalid"
+            record.error = str(e)
+        return record
+
+    def process_batch(self, batch: List[Any]) -> List[Record]:
+        """
+        Validates a whole chunk of records in a single call.
+        Non-empty plain dicts take an inline fast path while dict is
+        handled by the built-in kind.
+        """
+        process = self.process
+        if self.registry.resolve(dict) is not DICT_KIND:
+            return [process(item) for item in batch]
+        return [
+            Record(item, "valid", "dict")
+            if type(item) is dict and item else process(item)
+            for item in batch
+        ]
 
 
 class TransformStage:
     """
     Enriches valid data with metadata
     and structural summaries based on type.
+    Records are annotated in place; copy_on_write makes the stage work
+    on a copy instead, for branches that still need the original.
     """
+    # Invalid records pass through unchanged, so long sealed plans skip it.
+    skips_invalid: bool = True
+
+    def __init__(
+        self,
+        copy_on_write: bool = False,
+        registry: Optional[PayloadRegistry] = None
+    ) -> None:
+        """Selects in-place annotation (default) or copy-on-write."""
+        self.copy_on_write: bool = copy_on_write
+        self.registry: PayloadRegistry = registry or DEFAULT_REGISTRY
 
-    def process(self, data: Dict[str, Any]) -> Dict[str, Any]:
+    def process(self, data: Union[Record, Dict[str, Any]]) -> Record:
+        record: Record = (
+            Record.from_dict(data) if isinstance(data, dict) else data)
+        if record.status == "invalid":
+            return record
+        if self.copy_on_write:
+            record = record.copy()
         try:
-            if data.get("status") == "invalid":
-                return data
-            raw: Any = data.get("raw")
-            data_type: Optional[str] = data.get("type")
-            if data_type == "dict":
-                return {
-                    **data,
-                    "status": "transformed",
-                    "keys": list(raw.keys()),
-                    "size": len(raw),
-                    "summary": f"Dict with {len(raw)} fields"
-                }
-            elif data_type == "str":
-                words: List[str] = raw.split()
-                return {
-                    **data,
-                    "status": "transformed",
-                    "words": words,
-                    "word_count": len(words),
-                    "char_count": len(raw),
-                    "summary": f"Text with {len(words)} words"
-                }
-            elif data_type == "list":
-                return {
-                    **data,
-                    "status": "transformed",
-                    "count": len(raw),
-                    "summary": f"List with {len(raw)} items"
-                }
-            else:
+            data_type: Optional[str] = record.get("type")
+            kind: Optional[PayloadKind] = (
+                self.registry.kinds.get(data_type)
+                if isinstance(data_type, str) else None)
+            if kind is None:
                 raise ValueError(f"Unknown data type: {data_type}")
+            kind.transform(record)
+            record.status = "transformed"
         except (KeyError, AttributeError, ValueError) as e:
-            return {
-                **data,
-                "status": "invalid",
-                "error": f"Transform failed: {str(e)}"
-            }
+            record.status = "invalid"
+            record.error = f"Transform failed: {str(e)}"
+        return record
+
+    def process_batch(
+        self, batch: List[Union[Record, Dict[str, Any]]]
+    ) -> List[Record]:
+        """
+        Enriches a whole chunk, passing invalid records through as-is.
+        Valid dict records take an inline fast path while dict is
+        handled by the built-in kind.
+        """
+        process = self.process
+        if (self.copy_on_write
+                or self.registry.kinds.get("dict") is not DICT_KIND):
+            return [process(item) for item in batch]
+        records: List[Record] = [
+            item if isinstance(item, Record) else Record.from_dict(item)
+            for item in batch
+        ]
+        for item in records:
+            if item.status == "valid" and item.get("type") == "dict":
+                raw: Dict[str, Any] = item.raw
+                size: int = len(raw)
+                item.keys = list(raw)
+                item.size = size
+                item.summary = f"Dict with {size} fields"
+                item.status = "transformed"
+            elif item.status != "invalid":
+                process(item)
+        return records
 
 
 class OutputStage:
     """Formats the transformed data into a human-readable string report."""
-    def process(self, data: Dict[str, Any]) -> str:
+    def __init__(self, registry: Optional[PayloadRegistry] = None) -> None:
+        """Uses DEFAULT_REGISTRY unless another registry is given."""
+        self.registry: PayloadRegistry = registry or DEFAULT_REGISTRY
+
+    def process(self, data: Union[Record, Dict[str, Any]]) -> str:
         try:
             if data.get("status") == "invalid":
                 err_msg = data.get('error', 'Unknown error')
                 return f"[ERROR] Pipeline failed: {err_msg}"
-            data_type: Optional[str] = data.get("type")
-            summary: str = str(data.get("summary", "No summary available"))
-            if data_type == "dict":
-                keys: List[str] = data.get("keys", [])
-                size: int = data.get("size", 0)
-                return (
-                    f"[OUTPUT] Dict processed successfully\n"
-                    f"  Summary : {summary}\n"
-                    f"  Fields  : {', '.join(keys)}\n"
-                    f"  Size    : {size} fields"
-                )
-            elif data_type == "str":
-                word_count: int = data.get("word_count", 0)
-                char_count: int = data.get("char_count", 0)
-                return (
-                    f"[OUTPUT] Text processed successfully\n"
-                    f"  Summary : {summary}\n"
-                    f"  Words   : {word_count}\n"
-                    f"  Chars   : {char_count}"
-                )
-            elif data_type == "list":
-                count: int = data.get("count", 0)
-                return (
-                    f"[OUTPUT] List processed successfully\n"
-                    f"  Summary : {summary}\n"
-                    f"  Items   : {count}"
-                )
-            else:
+            data_type: Any = data.get("type")
+            kind: Optional[PayloadKind] = (
+                self.registry.kinds.get(data_type)
+                if isinstance(data_type, str) else None)
+            if kind is None:
+                summary: str = str(
+                    data.get("summary", "No summary available"))
                 return f"[OUTPUT] Unknown type processed: {summary}"
+            return kind.format(data)
         except (KeyError, AttributeError) as e:
             return f"[ERROR] Output formatting failed: {str(e)}"
 
+    def process_batch(
+        self, batch: List[Union[Record, Dict[str, Any]]]
+    ) -> List[str]:
+        """Formats a whole chunk of transformed records into reports."""
+        process = self.process
+        return [process(item) for item in batch]
+
+
+class LatencyHistogram:
+    """
+    Fixed-bucket latency histogram. Recording costs one bisect, and
+    percentiles resolve to the upper bound of the matching bucket.
+    """
+    DEFAULT_BOUNDS: Tuple[float, ...] = tuple(
+        10 ** (exponent / 4) * 1e-6 for exponent in range(29)
+    )
+
+    def __init__(self, bounds: Optional[Iterable[float]] = None) -> None:
+        """Creates empty buckets (1us to 10s, 4 per decade by default)."""
+        self.bounds: Tuple[float, ...] = tuple(
+            sorted(bounds if bounds is not None else self.DEFAULT_BOUNDS))
+        self.counts: List[int] = [0] * (len(self.bounds) + 1)
+        self.count: int = 0
+        self.total: float = 0.0
+        self.max: float = 0.0
+
+    def record(self, seconds: float) -> None:
+        """Adds one observation to its bucket."""
+        self.counts[bisect_left(self.bounds, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def percentile(self, q: float) -> float:
+        """Returns the bucket bound below which q percent of calls fell."""
+        if self.count == 0:
+            return 0.0
+        target: int = max(1, math.ceil(self.count * q / 100))
+        cumulative: int = 0
+        for index, bucket in enumerate(self.counts):
+            cumulative += bucket
+            if cumulative >= target:
+                if index < len(self.bounds):
+                    return min(self.bounds[index], self.max)
+                break
+        return self.max
+
+    def to_dict(self) -> Dict[str, float]:
+        """Summarizes the histogram in milliseconds."""
+        mean: float = self.total / self.count if self.count else 0.0
+        return {
+            "count": self.count,
+            "mean_ms": mean * 1000,
+            "p50_ms": self.percentile(50) * 1000,
+            "p95_ms": self.percentile(95) * 1000,
+            "p99_ms": self.percentile(99) * 1000,
+            "max_ms": self.max * 1000
+        }
+
+
+# A hook receives (stage, data), calls stage.process(data) itself and
+# returns its result, which lets it wrap the call in a profiler.
+StageHook = Callable[[Any, Any], Any]
+
+
+class ProfileHook:
+    """Stage hook that runs the wrapped stage under cProfile."""
+    def __init__(self) -> None:
+        """Creates the profiler that accumulates across calls."""
+        self.profiler: cProfile.Profile = cProfile.Profile()
+
+    def __call__(self, stage: Any, data: Any) -> Any:
+        self.profiler.enable()
+        try:
+            return stage.process(data)
+        finally:
+            self.profiler.disable()
+
+    def print_stats(self, sort: str = "cumulative") -> None:
+        """Prints the collected profile for the hooked stage."""
+        self.profiler.print_stats(sort)
+
+
+_SCALAR_TYPES: frozenset[type] = frozenset(
+    (str, int, float, bool, bytes, type(None)))
+
+
+def fingerprint(data: Any) -> Optional[Hashable]:
+    """
+    Builds a hashable structural key for a payload, tagging scalars with
+    their type so that 1, 1.0 and True stay distinct at every depth,
+    dict keys included. Flat dicts and lists whose keys and values are
+    all scalars are keyed in one C-level pass. Returns None for payloads
+    that cannot be fingerprinted cheaply.
+    """
+    if type(data) is str:
+        return data
+    data_type: type = type(data)
+    if data_type in (int, float, bool, bytes) or data is None:
+        return (data_type, data)
+    if data_type is dict:
+        key_types: Tuple[type, ...] = tuple(map(type, data))
+        value_types: Tuple[type, ...] = tuple(map(type, data.values()))
+        if (_SCALAR_TYPES.issuperset(key_types)
+                and _SCALAR_TYPES.issuperset(value_types)):
+            return (dict, tuple(data.items()), key_types, value_types)
+        items: List[Tuple[Hashable, Hashable]] = []
+        for key, value in data.items():
+            key_key: Optional[Hashable] = fingerprint(key)
+            value_key: Optional[Hashable] = fingerprint(value)
+            if key_key is None or value_key is None:
+                return None
+            items.append((key_key, value_key))
+        return (dict, tuple(items))
+    if data_type in (list, tuple):
+        value_types = tuple(map(type, data))
+        if _SCALAR_TYPES.issuperset(value_types):
+            return (data_type, tuple(data), value_types)
+        values: List[Hashable] = []
+        for value in data:
+            value_key = fingerprint(value)
+            if value_key is None:
+                return None
+            values.append(value_key)
+        return (data_type, tuple(values))
+    if data_type is array:
+        return (array, data.typecode, data.tobytes())
+    if np is not None and data_type is np.ndarray:
+        return (np.ndarray, data.dtype.str, data.shape, data.tobytes())
+    return None
+
+
+def _deep_size(data: Any) -> int:
+    """
+    Estimates the memory held by an object graph: sys.getsizeof of every
+    distinct object reachable through containers and Record slots.
+    Classes, such as the type tags in fingerprints, are shared and not
+    counted.
+    """
+    seen: set[int] = set()
+    pending: List[Any] = [data]
+    total: int = 0
+    while pending:
+        item: Any = pending.pop()
+        if id(item) in seen or isinstance(item, type):
+            continue
+        seen.add(id(item))
+        total += sys.getsizeof(item)
+        if isinstance(item, dict):
+            pending.extend(item.keys())
+            pending.extend(item.values())
+        elif isinstance(item, (list, tuple, set, frozenset, deque)):
+            pending.extend(item)
+        elif isinstance(item, Record):
+            pending.extend(
+                getattr(item, key) for key in Record.__slots__
+                if hasattr(item, key))
+    return total
+
+
+class ResultCache:
+    """
+    Bounded LRU cache of pipeline results with an optional TTL. Keys and
+    results are sized deeply when stored, and the least recently used
+    entries are evicted once max_bytes is exceeded.
+    """
+    def __init__(
+        self, max_bytes: int = 16 * 1024 * 1024, ttl: Optional[float] = None
+    ) -> None:
+        """Sets the byte budget and the lifetime of entries in seconds."""
+        self.max_bytes: int = max_bytes
+        self.ttl: Optional[float] = ttl
+        self.entries: OrderedDict[Hashable, Tuple[float, int, Any]] = (
+            OrderedDict())
+        self.size: int = 0
+        self.hits: int = 0
+        self.misses: int = 0
+        self.evictions: int = 0
+        self.expirations: int = 0
+
+    def get(self, key: Hashable) -> Tuple[bool, Any]:
+        """Returns (True, result) on a live hit, (False, None) otherwise."""
+        entry: Optional[Tuple[float, int, Any]] = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return False, None
+        expires_at, size, result = entry
+        if expires_at and expires_at < time.monotonic():
+            del self.entries[key]
+            self.size -= size
+            self.expirations += 1
+            self.misses += 1
+            return False, None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return True, result
+
+    def put(self, key: Hashable, result: Any) -> None:
+        """Stores a result, evicting old entries to respect max_bytes."""
+        size: int = _deep_size(key) + _deep_size(result)
+        if size > self.max_bytes:
+            return
+        previous: Optional[Tuple[float, int, Any]] = self.entries.pop(
+            key, None)
+        if previous is not None:
+            self.size -= previous[1]
+        expires_at: float = (
+            time.monotonic() + self.ttl if self.ttl is not None else 0.0)
+        self.entries[key] = (expires_at, size, result)
+        self.size += size
+        while self.size > self.max_bytes:
+            _, (_, evicted_size, _) = self.entries.popitem(last=False)
+            self.size -= evicted_size
+            self.evictions += 1
+
+    def clear(self) -> None:
+        """Drops every entry while keeping the counters."""
+        self.entries.clear()
+        self.size = 0
+
+    def to_dict(self) -> Dict[str, int]:
+        """Summarizes counters and current occupancy."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "entries": len(self.entries),
+            "bytes": self.size,
+            "max_bytes": self.max_bytes
+        }
+
+
+class StageInstrumentation:
+    """Per-stage latency histograms and optional hooks for a pipeline."""
+    def __init__(self, bounds: Optional[Iterable[float]] = None) -> None:
+        """Starts with no recorded stages and no hooks."""
+        self.bounds: Optional[Tuple[float, ...]] = (
+            tuple(bounds) if bounds is not None else None)
+        self.histograms: Dict[int, LatencyHistogram] = {}
+        self.hooks: Dict[int, StageHook] = {}
+
+    def histogram(self, index: int) -> LatencyHistogram:
+        """Returns the histogram of a stage, creating it on first use."""
+        histogram: Optional[LatencyHistogram] = self.histograms.get(index)
+        if histogram is None:
+            histogram = LatencyHistogram(self.bounds)
+            self.histograms[index] = histogram
+        return histogram
+
+
+class QueueMetrics:
+    """Occupancy and producer stall time of one inter-stage queue."""
+    def __init__(self, depth: int) -> None:
+        """Starts empty counters for a queue of the given depth."""
+        self.depth: int = depth
+        self.puts: int = 0
+        self.occupancy_total: int = 0
+        self.max_occupancy: int = 0
+        self.stalls: int = 0
+        self.stall_time: float = 0.0
+
+    def record_put(self, occupancy: int, waited: float) -> None:
+        """Counts a put made at occupancy that blocked for waited seconds."""
+        self.puts += 1
+        self.occupancy_total += occupancy
+        if occupancy > self.max_occupancy:
+            self.max_occupancy = occupancy
+        if occupancy >= self.depth:
+            self.stalls += 1
+            self.stall_time += waited
+
+    def to_dict(self) -> Dict[str, float]:
+        """Summarizes the queue, stall time in milliseconds."""
+        mean: float = self.occupancy_total / self.puts if self.puts else 0.0
+        return {
+            "depth": self.depth,
+            "puts": self.puts,
+            "mean_occupancy": mean,
+            "max_occupancy": self.max_occupancy,
+            "stalls": self.stalls,
+            "stall_ms": self.stall_time * 1000
+        }
+
+
+class _StageFailure:
+    """Marks a record that raised, so later stages pass it through."""
+    __slots__ = ("message",)
+
+    def __init__(self, message: str) -> None:
+        self.message: str = message
+
+
+class _StageCrash:
+    """Carries an exception that stopped a feeder or stage thread."""
+    __slots__ = ("error",)
+
+    def __init__(self, error: BaseException) -> None:
+        self.error: BaseException = error
+
+
+_END_OF_STREAM: Any = object()
+
 
 class ProcessingPipeline(ABC):
     """Abstract base class for orchestrating data through sequential stages."""
-    def __init__(self, pipeline_id: str) -> None:
-        """Initializes the pipeline with an ID and empty stage list."""
+    def __init__(
+        self, pipeline_id: str, reporter: Optional[Reporter] = None
+    ) -> None:
+        """
+        Initializes the pipeline with an ID and empty stage list.
+        Progress messages go to reporter, silent when omitted.
+        """
         self.pipeline_id: str = pipeline_id
-        self.stages: List[ProcessingStage] = []
+        self.reporter: Reporter = reporter or NullReporter()
+        self.stages: List[Union[ProcessingStage, AsyncProcessingStage]] = []
         self.stats: defaultdict[str, int] = defaultdict(int)
+        self.instrumentation: Optional[StageInstrumentation] = None
+        self._plan: Optional[Callable[[Any], Any]] = None
+        self.cache: Optional[ResultCache] = None
+        self.queue_metrics: List[QueueMetrics] = []
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """Drops the sealed plan closure, which cannot be pickled."""
+        state: Dict[str, Any] = self.__dict__.copy()
+        state["_plan"] = None
+        return state
 
-    def add_stage(self, stage: ProcessingStage) -> None:
+    def add_stage(
+        self, stage: Union[ProcessingStage, AsyncProcessingStage]
+    ) -> None:
         """Appends a new processing stage to the internal sequence."""
         self.stages.append(stage)
+        self._plan = None
+        if self.cache is not None:
+            self.cache.clear()
+
+    def seal(self) -> Callable[[Any], Any]:
+        """
+        Resolves the stage list into one plan function with each stage's
+        process method looked up once. Up to three stages are chained as
+        direct nested calls: a single stage's process method is the plan
+        itself. Longer plans loop over the methods and skip stages marked
+        skips_invalid once an invalid Record comes through; those stages
+        pass such records through unchanged, so short plans just call
+        them. run_stages seals lazily, and add_stage discards the plan
+        so it is rebuilt on next use.
+        """
+        processes: Tuple[Callable[[Any], Any], ...] = tuple(
+            stage.process for stage in self.stages)
+        plan: Callable[[Any], Any]
+        if not processes:
+            def plan(result: Any) -> Any:
+                return result
+        elif len(processes) == 1:
+            plan = processes[0]
+        elif len(processes) == 2:
+            first, second = processes
+
+            def plan(result: Any) -> Any:
+                return second(first(result))
+        elif len(processes) == 3:
+            first, second, third = processes
+
+            def plan(result: Any) -> Any:
+                return third(second(first(result)))
+        else:
+            steps: Tuple[Tuple[Callable[[Any], Any], bool], ...] = tuple(
+                (stage.process, getattr(stage, "skips_invalid", False))
+                for stage in self.stages
+            )
+
+            def plan(result: Any) -> Any:
+                for process, skips_invalid in steps:
+                    if (skips_invalid and result.__class__ is Record
+                            and result.status == "invalid"):
+                        continue
+                    result = process(result)
+                return result
+
+        self._plan = plan
+        return plan
+
+    def enable_instrumentation(
+        self, bounds: Optional[Iterable[float]] = None
+    ) -> StageInstrumentation:
+        """
+        Turns on per-stage timing for run_stages. bounds overrides the
+        histogram bucket edges, in seconds.
+        """
+        if self.instrumentation is None:
+            self.instrumentation = StageInstrumentation(bounds)
+        return self.instrumentation
+
+    def disable_instrumentation(self) -> None:
+        """Turns timing off and drops collected histograms and hooks."""
+        self.instrumentation = None
+
+    def set_stage_hook(self, index: int, hook: Optional[StageHook]) -> None:
+        """
+        Attaches a hook (e.g. ProfileHook) around a single stage, or
+        removes it when hook is None. Enables instrumentation.
+        """
+        if not 0 <= index < len(self.stages):
+            raise IndexError(f"No stage at index {index}")
+        instrumentation: StageInstrumentation = self.enable_instrumentation()
+        if hook is None:
+            instrumentation.hooks.pop(index, None)
+        else:
+            instrumentation.hooks[index] = hook
+
+    def enable_cache(
+        self, max_bytes: int = 16 * 1024 * 1024, ttl: Optional[float] = None
+    ) -> ResultCache:
+        """
+        Memoizes run_stages results by payload fingerprint, so repeated
+        identical payloads skip the whole stage chain. Best suited to
+        pipelines whose final stage returns immutable output (strings).
+        """
+        if self.cache is None:
+            self.cache = ResultCache(max_bytes, ttl)
+        return self.cache
+
+    def disable_cache(self) -> None:
+        """Turns memoization off and drops the cached results."""
+        self.cache = None
 
     def run_stages(self, data: Any) -> Any:
         """Executes each registered stage in order on the provided data."""
+        cache: Optional[ResultCache] = self.cache
+        if cache is not None:
+            return self._run_stages_cached(data, cache)
+        instrumentation: Optional[StageInstrumentation] = (
+            self.instrumentation)
+        if instrumentation is not None:
+            return self._run_stages_instrumented(data, instrumentation)
+        plan: Optional[Callable[[Any], Any]] = self._plan
+        if plan is None:
+            plan = self.seal()
+        try:
+            result: Any = plan(data)
+        except Exception as e:
+            self.stats["errors"] += 1
+            return f"[ERROR] Stage failed: {str(e)}"
+        self.stats["stages_run"] += len(self.stages)
+        return result
+
+    def _run_stages_cached(self, data: Any, cache: ResultCache) -> Any:
+        """
+        Serves repeated payloads from the cache. Runs that report an
+        error are not cached, so transient failures are retried.
+        """
+        key: Optional[Hashable] = fingerprint(data)
+        if key is not None:
+            hit, cached = cache.get(key)
+            if hit:
+                return cached
+        errors: int = self.stats["errors"]
+        instrumentation: Optional[StageInstrumentation] = (
+            self.instrumentation)
+        if instrumentation is not None:
+            result: Any = self._run_stages_instrumented(
+                data, instrumentation)
+        else:
+            result = self._run_plan(data)
+        if key is not None and self.stats["errors"] == errors:
+            cache.put(key, result)
+        return result
+
+    def _run_plan(self, data: Any) -> Any:
+        """Runs the sealed plan, sealing the pipeline first if needed."""
+        plan: Optional[Callable[[Any], Any]] = self._plan
+        if plan is None:
+            plan = self.seal()
+        try:
+            result: Any = plan(data)
+        except Exception as e:
+            self.stats["errors"] += 1
+            return f"[ERROR] Stage failed: {str(e)}"
+        self.stats["stages_run"] += len(self.stages)
+        return result
+
+    def _run_stages_instrumented(
+        self, data: Any, instrumentation: StageInstrumentation
+    ) -> Any:
+        """run_stages variant that times each stage and applies hooks."""
+        hooks: Dict[int, StageHook] = instrumentation.hooks
+        clock = time.perf_counter
+        result: Any = data
+        try:
+            for index, stage in enumerate(self.stages):
+                hook: Optional[StageHook] = hooks.get(index)
+                start: float = clock()
+                if hook is None:
+                    result = stage.process(result)
+                else:
+                    result = hook(stage, result)
+                instrumentation.histogram(index).record(clock() - start)
+                self.stats["stages_run"] += 1
+        except Exception as e:
+            self.stats["errors"] += 1
+            return f"[ERROR] Stage failed: {str(e)}"
+        return result
+
+    async def run_stages_async(self, data: Any) -> Any:
+        """
+        Executes each stage in order, awaiting async stages and running
+        synchronous ones inline.
+        """
         result: Any = data
         try:
             for stage in self.stages:
                 result = stage.process(result)
+                if inspect.isawaitable(result):
+                    result = await result
                 self.stats["stages_run"] += 1
         except Exception as e:
             self.stats["errors"] += 1
             return f"[ERROR] Stage failed: {str(e)}"
         return result
 
-    def get_stats(self) -> Dict[str, Union[str, int]]:
-        """Returns diagnostic statistics for the pipeline instance."""
-        return {
+    def stream_stages(self, records: Iterable[Any]) -> Iterator[Any]:
+        """Lazily yields each record as soon as it clears every stage."""
+        run_stages = self.run_stages
+        for record in records:
+            yield run_stages(record)
+
+    def run_staged(
+        self, records: Iterable[Any], queue_depth: int = 64
+    ) -> Iterator[Any]:
+        """
+        Producer/consumer mode: every stage runs in its own thread and
+        hands records on through a bounded queue, so a slow stage fills
+        its input queue and stalls upstream producers instead of the
+        whole pipeline being coupled call by call. Results are yielded in
+        input order; occupancy and stall time land in get_stats(). If the
+        records iterable or a stage thread itself raises, the exception
+        is forwarded down the queues and re-raised here. queue_depth
+        must be positive: a queue of size 0 would be unbounded.
+        """
+        if queue_depth < 1:
+            raise ValueError("queue_depth must be positive")
+        return self._run_staged(records, queue_depth)
+
+    def _run_staged(
+        self, records: Iterable[Any], queue_depth: int
+    ) -> Iterator[Any]:
+        """Generator behind run_staged, started on first iteration."""
+        stages: List[Any] = list(self.stages)
+        queues: List[queue.Queue[Any]] = [
+            queue.Queue(maxsize=queue_depth)
+            for _ in range(len(stages) + 1)
+        ]
+        self.queue_metrics = [QueueMetrics(queue_depth) for _ in queues]
+        stop: threading.Event = threading.Event()
+        lock: threading.Lock = threading.Lock()
+
+        def put(index: int, item: Any) -> bool:
+            target: queue.Queue[Any] = queues[index]
+            occupancy: int = target.qsize()
+            start: float = time.perf_counter()
+            while not stop.is_set():
+                try:
+                    target.put(item, timeout=0.1)
+                except queue.Full:
+                    continue
+                self.queue_metrics[index].record_put(
+                    occupancy, time.perf_counter() - start)
+                return True
+            return False
+
+        def feed() -> None:
+            try:
+                for record in records:
+                    if not put(0, record):
+                        return
+            except BaseException as e:
+                put(0, _StageCrash(e))
+                return
+            put(0, _END_OF_STREAM)
+
+        def work(index: int, stage: Any) -> None:
+            process: Callable[[Any], Any] = stage.process
+            done: int = 0
+            errors: int = 0
+            end: Any = _END_OF_STREAM
+            try:
+                while True:
+                    try:
+                        item: Any = queues[index].get(timeout=0.1)
+                    except queue.Empty:
+                        if stop.is_set():
+                            break
+                        continue
+                    if item is _END_OF_STREAM:
+                        break
+                    if isinstance(item, _StageCrash):
+                        end = item
+                        break
+                    if not isinstance(item, _StageFailure):
+                        try:
+                            item = process(item)
+                            done += 1
+                        except Exception as e:
+                            item = _StageFailure(
+                                f"[ERROR] Stage failed: {str(e)}")
+                            errors += 1
+                    if not put(index + 1, item):
+                        break
+            except BaseException as e:
+                end = _StageCrash(e)
+            finally:
+                with lock:
+                    self.stats["stages_run"] += done
+                    self.stats["errors"] += errors
+            put(index + 1, end)
+
+        threads: List[threading.Thread] = [
+            threading.Thread(target=feed, daemon=True)
+        ] + [
+            threading.Thread(target=work, args=(i, stage), daemon=True)
+            for i, stage in enumerate(stages)
+        ]
+        for thread in threads:
+            thread.start()
+        output: queue.Queue[Any] = queues[-1]
+        try:
+            while True:
+                try:
+                    item = output.get(timeout=0.1)
+                except queue.Empty:
+                    if any(thread.is_alive() for thread in threads):
+                        continue
+                    if output.empty():
+                        raise RuntimeError(
+                            "Staged pipeline stopped without finishing")
+                    continue
+                if item is _END_OF_STREAM:
+                    break
+                if isinstance(item, _StageCrash):
+                    raise item.error
+                if isinstance(item, _StageFailure):
+                    yield item.message
+                else:
+                    yield item
+        finally:
+            stop.set()
+            for thread in threads:
+                thread.join()
+
+    def run_batch(
+        self, records: List[Any], chunk_size: int = 1024
+    ) -> List[Any]:
+        """
+        Executes each stage once per chunk of records instead of once per
+        record. Stages without process_batch fall back to the per-record
+        path.
+        """
+        results: List[Any] = []
+        for start in range(0, len(records), chunk_size):
+            results.extend(
+                self._run_chunk(records[start:start + chunk_size]))
+        return results
+
+    def _run_chunk(self, chunk: List[Any]) -> List[Any]:
+        """
+        Pushes a single chunk through every stage in order. If a stage
+        raises, the chunk is rerun record by record through run_stages so
+        the failure stays confined to the records that caused it.
+        """
+        result: List[Any] = chunk
+        stages_run: int = self.stats["stages_run"]
+        try:
+            for stage in self.stages:
+                process_batch = getattr(stage, "process_batch", None)
+                if process_batch is not None:
+                    result = process_batch(result)
+                else:
+                    process = stage.process
+                    result = [process(item) for item in result]
+                self.stats["stages_run"] += len(chunk)
+        except Exception:
+            self.stats["stages_run"] = stages_run
+            run_stages = self.run_stages
+            return [run_stages(item) for item in chunk]
+        return result
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Returns diagnostic statistics for the pipeline instance, plus
+        per-stage latency summaries when instrumentation is enabled.
+        """
+        stats: Dict[str, Any] = {
             "pipeline_id": self.pipeline_id,
             "stages_count": len(self.stages),
             "stages_run": self.stats["stages_run"],
             "errors": self.stats["errors"],
             "processed": self.stats["processed"]
         }
+        if self.cache is not None:
+            stats["cache"] = self.cache.to_dict()
+        if self.queue_metrics:
+            stats["queues"] = {
+                f"queue_{index}": metrics.to_dict()
+                for index, metrics in enumerate(self.queue_metrics)
+            }
+        if self.instrumentation is not None:
+            stats["latency"] = {
+                f"{index}:{type(self.stages[index]).__name__}":
+                    histogram.to_dict()
+                for index, histogram
+                in sorted(self.instrumentation.histograms.items())
+                if index < len(self.stages)
+            }
+        return stats
+
+    def parse(self, data: Any) -> Any:
+        """Converts a raw payload into the first stage's input."""
+        return data
+
+    async def process_async(self, data: Any) -> Union[str, Any]:
+        """Parses the payload and runs it through the async stage path."""
+        try:
+            result: Any = await self.run_stages_async(self.parse(data))
+            self.stats["processed"] += 1
+            return result
+        except Exception as e:
+            self.stats["errors"] += 1
+            return f"[ERROR] Pipeline {self.pipeline_id} failed: {str(e)}"
 
     @abstractmethod
     def process(self, data: Any) -> Union[str, Any]:
@@ -181,12 +1217,14 @@ class ProcessingPipeline(ABC):
 
 class JSONAdapter(ProcessingPipeline):
     """Adapter for processing dictionary-based JSON payloads."""
-    def __init__(self, pipeline_id: str) -> None:
+    def __init__(
+        self, pipeline_id: str, reporter: Optional[Reporter] = None
+    ) -> None:
         """
         Configures the JSON pipeline
         with default processing stages.
         """
-        super().__init__(pipeline_id)
+        super().__init__(pipeline_id, reporter)
         self.add_stage(InputStage())
         self.add_stage(TransformStage())
         self.add_stage(OutputStage())
@@ -197,99 +1235,653 @@ class JSONAdapter(ProcessingPipeline):
         environment-specific transformations.
         """
         try:
-            print("Processing JSON data through pipeline...")
-            print(f'Input: {data}')
+            reporter: Reporter = self.reporter
+            if reporter.enabled:
+                reporter.report(self.pipeline_id,
+                                "Processing JSON data through pipeline...")
+                reporter.report(self.pipeline_id, f'Input: {data}')
             result: Any = self.run_stages(data)
             self.stats["processed"] += 1
-            value: Any = data.get("value", "N/A")
-            unit: Any = data.get("unit", "")
-            print("Transform: Enriched with metadata and validation")
-            print(f"Output: Processed temperature reading: {value}°{unit} "
-                  "(Normal range)")
+            if reporter.enabled:
+                value: Any = data.get("value", "N/A")
+                unit: Any = data.get("unit", "")
+                reporter.report(
+                    self.pipeline_id,
+                    "Transform: Enriched with metadata and validation")
+                reporter.report(
+                    self.pipeline_id,
+                    f"Output: Processed temperature reading: {value}°{unit} "
+                    "(Normal range)")
             return result
         except Exception as e:
             self.stats["errors"] += 1
             return f"[ERROR] JSON parsing failed: {str(e)}"
 
 
+def _coerce_cell(value: str) -> Union[int, float, str]:
+    """Converts a CSV cell to int or float when it looks numeric."""
+    try:
+        return int(value)
+    except ValueError:
+        pass
+    try:
+        return float(value)
+    except ValueError:
+        return value
+
+
+def _convert_cell(
+    converters: Dict[int, Callable[[str], Any]], column: int, value: str
+) -> Any:
+    """
+    Applies the converter cached for a column. The first value seen
+    decides int, float or str; a later mismatch downgrades the column
+    to the generic per-cell coercion.
+    """
+    converter: Optional[Callable[[str], Any]] = converters.get(column)
+    if converter is None:
+        converter = type(_coerce_cell(value))
+        converters[column] = converter
+    try:
+        return converter(value)
+    except ValueError:
+        converters[column] = _coerce_cell
+        return _coerce_cell(value)
+
+
 class CSVAdapter(ProcessingPipeline):
     """Adapter for processing comma-separated string data."""
-    def __init__(self, pipeline_id: str) -> None:
+    def __init__(
+        self, pipeline_id: str, reporter: Optional[Reporter] = None
+    ) -> None:
         """Configures the CSV pipeline with default processing stages."""
-        super().__init__(pipeline_id)
+        super().__init__(pipeline_id, reporter)
         self.add_stage(InputStage())
         self.add_stage(TransformStage())
         self.add_stage(OutputStage())
 
+    def parse(self, data: str) -> Dict[str, int]:
+        """Maps each comma-separated value to its column index."""
+        values: List[str] = [v.strip() for v in data.split(",")]
+        return {value: i for i, value in enumerate(values)}
+
     def process(self, data: str) -> Union[str, Any]:
         """
         Parses CSV strings into dictionaries
         before running pipeline.
         """
         try:
-            print("Processing CSV data through same pipeline...")
-            print(f"Input: \"{data}\"")
-            values: List[str] = [v.strip() for v in data.split(",")]
-            parsed: Dict[str, int] = {
-                    value: i for i, value in enumerate(values)}
-            result: Any = self.run_stages(parsed)
+            reporter: Reporter = self.reporter
+            if reporter.enabled:
+                reporter.report(
+                    self.pipeline_id,
+                    "Processing CSV data through same pipeline...")
+                reporter.report(self.pipeline_id, f"Input: \"{data}\"")
+            result: Any = self.run_stages(self.parse(data))
             self.stats["processed"] += 1
-            print("Transform: Parsed and structured data")
-            print("Output: User activity logged: 1 actions processed")
+            if reporter.enabled:
+                reporter.report(self.pipeline_id,
+                                "Transform: Parsed and structured data")
+                reporter.report(
+                    self.pipeline_id,
+                    "Output: User activity logged: 1 actions processed")
             return result
         except (ValueError, AttributeError) as e:
             self.stats["errors"] += 1
             return f"[ERROR] CSV parsing failed: {str(e)}"
 
+    def process_file(
+        self,
+        source: Union[str, "os.PathLike[str]", TextIO],
+        has_header: bool = True,
+        chunk_size: int = 1024,
+        buffer_size: int = 1 << 20
+    ) -> Iterator[Any]:
+        """
+        Streams a CSV file (path or open text stream) through the stages.
+        Rows are read through a large buffer with the csv module, turned
+        into typed dicts and pushed through run_batch one chunk at a time,
+        so results are yielded before the whole file has been read.
+        """
+        if isinstance(source, (str, os.PathLike)):
+            with open(source, newline="", buffering=buffer_size) as file:
+                yield from self._process_rows(
+                    csv.reader(file), has_header, chunk_size)
+        else:
+            yield from self._process_rows(
+                csv.reader(source), has_header, chunk_size)
+
+    def _process_rows(
+        self, reader: Iterator[List[str]], has_header: bool, chunk_size: int
+    ) -> Iterator[Any]:
+        """Converts reader rows into typed dicts and runs them in chunks."""
+        header: Optional[List[str]] = (
+            next(reader, None) if has_header else None)
+        converters: Dict[int, Callable[[str], Any]] = {}
+        chunk: List[Dict[str, Any]] = []
+        for row in reader:
+            if not row:
+                continue
+            if header is None:
+                header = [f"col_{i}" for i in range(len(row))]
+            chunk.append({
+                name: _convert_cell(converters, i, value)
+                for i, (name, value) in enumerate(zip(header, row))
+            })
+            if len(chunk) >= chunk_size:
+                self.stats["processed"] += len(chunk)
+                yield from self.run_batch(chunk, chunk_size)
+                chunk = []
+        if chunk:
+            self.stats["processed"] += len(chunk)
+            yield from self.run_batch(chunk, chunk_size)
+
 
 class StreamAdapter(ProcessingPipeline):
     """Adapter for processing real-time numerical sequence streams."""
-    def __init__(self, pipeline_id: str) -> None:
+    def __init__(
+        self, pipeline_id: str, reporter: Optional[Reporter] = None
+    ) -> None:
         """Configures the Stream pipeline with default processing stages."""
-        super().__init__(pipeline_id)
+        super().__init__(pipeline_id, reporter)
         self.add_stage(InputStage())
         self.add_stage(TransformStage())
         self.add_stage(OutputStage())
 
+    PERCENTILES: Tuple[int, ...] = (50, 95, 99)
+
+    @staticmethod
+    def to_array(data: Iterable[float]) -> Any:
+        """
+        Stores readings contiguously as float64: a NumPy array when
+        NumPy is installed, an array('d') otherwise. Iterators and other
+        non-sequences are consumed element by element.
+        """
+        if np is not None:
+            if isinstance(data, (np.ndarray, Sequence)):
+                return np.ascontiguousarray(data, dtype=np.float64)
+            return np.fromiter(data, np.float64)
+        return array("d", data)
+
+    def summarize(self, data: Iterable[float]) -> Dict[str, float]:
+        """
+        Computes count, mean, min, max, population std and the
+        PERCENTILES of a stream, vectorized when NumPy is available.
+        """
+        values: Any = self.to_array(data)
+        count: int = len(values)
+        if count == 0:
+            raise ValueError("Empty stream received")
+        summary: Dict[str, float] = {"count": count}
+        if np is not None:
+            summary["mean"] = float(values.mean())
+            summary["min"] = float(values.min())
+            summary["max"] = float(values.max())
+            summary["std"] = float(values.std())
+            points: Any = np.percentile(values, self.PERCENTILES)
+            for q, point in zip(self.PERCENTILES, points):
+                summary[f"p{q}"] = float(point)
+            return summary
+        mean: float = math.fsum(values) / count
+        summary["mean"] = mean
+        summary["min"] = min(values)
+        summary["max"] = max(values)
+        summary["std"] = math.sqrt(
+            math.fsum((v - mean) ** 2 for v in values) / count)
+        ordered: List[float] = sorted(values)
+        for q in self.PERCENTILES:
+            position: float = (count - 1) * q / 100
+            low: int = math.floor(position)
+            high: int = min(low + 1, count - 1)
+            summary[f"p{q}"] = ordered[low] + (
+                (ordered[high] - ordered[low]) * (position - low))
+        return summary
+
+    def rolling_mean(self, data: Iterable[float], window: int) -> Any:
+        """
+        Returns the mean of every full window of readings, using a
+        cumulative-sum difference so each step costs O(1).
+        """
+        if window <= 0:
+            raise ValueError("Window must be positive")
+        values: Any = self.to_array(data)
+        if len(values) < window:
+            return values[:0]
+        if np is not None:
+            sums: Any = np.cumsum(values)
+            sums[window:] = sums[window:] - sums[:-window]
+            return sums[window - 1:] / window
+        means: Any = array("d")
+        total: float = math.fsum(values[:window])
+        means.append(total / window)
+        for i in range(window, len(values)):
+            total += values[i] - values[i - window]
+            means.append(total / window)
+        return means
+
+    def parse(self, data: Iterable[float]) -> Dict[str, Any]:
+        """Wraps the readings as a float64 array with their aggregates."""
+        values: Any = self.to_array(data)
+        return {"raw": values, **self.summarize(values)}
+
     def process(self, data: List[float]) -> Union[str, Any]:
         """Aggregates stream data and executes processing stages."""
         try:
-            print("Processing Stream data through same pipeline...")
-            print("Input: Real-time sensor stream")
-            parsed: Dict[str, Any] = {"raw": data, "count": len(data)}
+            reporter: Reporter = self.reporter
+            if reporter.enabled:
+                reporter.report(
+                    self.pipeline_id,
+                    "Processing Stream data through same pipeline...")
+                reporter.report(self.pipeline_id,
+                                "Input: Real-time sensor stream")
+            parsed: Dict[str, Any] = self.parse(data)
             result: Any = self.run_stages(parsed)
             self.stats["processed"] += 1
-            avg: float = round(sum(data) / len(data), 1)
-            print("Transform: Aggregated and filtered")
-            print(f"Output: Stream summary: {len(data)} readings, "
-                  f"avg: {avg}°C")
+            avg: float = round(parsed["mean"], 1)
+            if reporter.enabled:
+                reporter.report(self.pipeline_id,
+                                "Transform: Aggregated and filtered")
+                reporter.report(
+                    self.pipeline_id,
+                    f"Output: Stream summary: {parsed['count']} readings, "
+                    f"avg: {avg}°C")
             return result
-        except (TypeError, ZeroDivisionError) as e:
+        except (TypeError, ValueError) as e:
             self.stats["errors"] += 1
             return f"[ERROR] Stream parsing failed: {str(e)}"
 
 
+def _is_error_result(result: Any) -> bool:
+    """Tells whether an adapter reported a failure in its result."""
+    return isinstance(result, str) and result.startswith("[ERROR]")
+
+
+class DeadLetter:
+    """A payload that failed in a pipeline, with its last error."""
+    __slots__ = ("pipeline_id", "payload", "error", "attempts", "failed_at")
+
+    def __init__(
+        self,
+        pipeline_id: str,
+        payload: Any,
+        error: str,
+        attempts: int = 1,
+        failed_at: Optional[float] = None
+    ) -> None:
+        """Records the failing pipeline, payload and error message."""
+        self.pipeline_id: str = pipeline_id
+        self.payload: Any = payload
+        self.error: str = error
+        self.attempts: int = attempts
+        self.failed_at: float = (
+            failed_at if failed_at is not None else time.time())
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Returns the entry as a JSON-friendly dictionary."""
+        return {key: getattr(self, key) for key in self.__slots__}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "DeadLetter":
+        """Rebuilds an entry read back from the spill file."""
+        return cls(**data)
+
+    def __repr__(self) -> str:
+        return f"DeadLetter({self.to_dict()})"
+
+
+class DeadLetterQueue:
+    """
+    Bounded store of failed records. The newest entries live in an
+    in-memory ring; when it is full the oldest entry is appended to the
+    JSON-lines spill file if one is configured, or dropped otherwise.
+    Only entries that survive a JSON round trip unchanged are spilled:
+    payloads holding tuples, arrays, Records or other non-JSON values
+    are dropped and counted as unspillable rather than replayed altered.
+    The spill file is read back from a stored offset and truncated once
+    fully drained; content it held before the queue opened it is left
+    alone. Thread-safe, so replay can run beside the main processing
+    path.
+    """
+    def __init__(
+        self,
+        capacity: int = 1000,
+        spill_path: Optional[Union[str, "os.PathLike[str]"]] = None,
+        max_attempts: int = 3
+    ) -> None:
+        """Sets the ring capacity, spill file and retry budget."""
+        self.capacity: int = capacity
+        self.spill_path: Optional[Union[str, "os.PathLike[str]"]] = (
+            spill_path)
+        self.max_attempts: int = max_attempts
+        self.ring: deque[DeadLetter] = deque()
+        self.spilled: int = 0
+        self.stats: defaultdict[str, int] = defaultdict(int)
+        self._lock: threading.Lock = threading.Lock()
+        self._spill_file: Optional[BinaryIO] = None
+        self._spill_base: int = 0
+        self._read_offset: Optional[int] = None
+
+    def __len__(self) -> int:
+        return len(self.ring) + self.spilled
+
+    def add(self, entry: DeadLetter) -> None:
+        """Stores a failed record, spilling or dropping the oldest."""
+        with self._lock:
+            if entry.attempts > self.max_attempts:
+                self.stats["exhausted"] += 1
+                return
+            self.ring.append(entry)
+            self.stats["captured"] += 1
+            if len(self.ring) > self.capacity:
+                self._evict(self.ring.popleft())
+
+    def _open_spill(self) -> Optional[BinaryIO]:
+        """
+        Returns the spill file handle, opening it on first use. Writes
+        always append; reads seek to the stored read offset.
+        """
+        if self._spill_file is None and self.spill_path is not None:
+            self._spill_file = open(self.spill_path, "a+b")
+            if self._read_offset is None:
+                self._spill_base = self._spill_file.seek(0, os.SEEK_END)
+                self._read_offset = self._spill_base
+        return self._spill_file
+
+    def _evict(self, entry: DeadLetter) -> None:
+        """Moves an entry out of the ring into the spill file."""
+        file: Optional[BinaryIO] = self._open_spill()
+        if file is None:
+            self.stats["dropped"] += 1
+            return
+        data: Dict[str, Any] = entry.to_dict()
+        try:
+            line: str = json.dumps(data)
+            exact: bool = json.loads(line) == data
+        except (TypeError, ValueError):
+            exact = False
+        if not exact:
+            self.stats["dropped"] += 1
+            self.stats["unspillable"] += 1
+            return
+        file.write(line.encode("utf-8") + b"\n")
+        self.spilled += 1
+
+    def drain(self, limit: int) -> List[DeadLetter]:
+        """
+        Removes and returns up to limit entries, oldest first: spilled
+        entries are read back before the in-memory ring.
+        """
+        with self._lock:
+            entries: List[DeadLetter] = []
+            if self.spilled:
+                entries.extend(self._read_spill(limit))
+            while self.ring and len(entries) < limit:
+                entries.append(self.ring.popleft())
+            return entries
+
+    def _read_spill(self, limit: int) -> List[DeadLetter]:
+        """
+        Reads the next entries from the spill file's read offset, so each
+        spilled line is read once. The file is truncated back to its
+        original length when every spilled entry has been read back.
+        """
+        file: Optional[BinaryIO] = self._open_spill()
+        if file is None or self._read_offset is None:
+            return []
+        file.flush()
+        file.seek(self._read_offset)
+        entries: List[DeadLetter] = []
+        while len(entries) < limit and len(entries) < self.spilled:
+            line: bytes = file.readline()
+            if not line:
+                break
+            entries.append(DeadLetter.from_dict(json.loads(line)))
+        self._read_offset = file.tell()
+        self.spilled -= len(entries)
+        if self.spilled == 0:
+            file.truncate(self._spill_base)
+            self._read_offset = self._spill_base
+        return entries
+
+    def close(self) -> None:
+        """Closes the spill file; it is reopened if needed again."""
+        with self._lock:
+            if self._spill_file is not None:
+                self._spill_file.close()
+                self._spill_file = None
+
+    def to_dict(self) -> Dict[str, int]:
+        """Summarizes occupancy and lifetime counters."""
+        return {
+            "in_memory": len(self.ring),
+            "spilled": self.spilled,
+            "captured": self.stats["captured"],
+            "dropped": self.stats["dropped"],
+            "exhausted": self.stats["exhausted"],
+            "unspillable": self.stats["unspillable"],
+            "replayed": self.stats["replayed"],
+            "replay_failed": self.stats["replay_failed"]
+        }
+
+
+def _run_pipeline(
+    pipeline: ProcessingPipeline, data: Any
+) -> Tuple[Any, Dict[str, int]]:
+    """
+    Worker entry point for pool execution. Returns the pipeline result
+    together with the stats it accumulated during this call.
+    """
+    before: Dict[str, int] = dict(pipeline.stats)
+    result: Any = pipeline.process(data)
+    delta: Dict[str, int] = {
+        key: value - before.get(key, 0)
+        for key, value in pipeline.stats.items()
+    }
+    return result, delta
+
+
 class NexusManager:
-    """Central management system for coordinating multiple data pipelines."""
-    def __init__(self) -> None:
-        """Initializes the manager with an empty pipeline registry."""
+    """
+    Central management system for coordinating multiple data pipelines.
+    The "thread" and "process" executors keep one pool for the lifetime
+    of the manager; call close() (or use it as a context manager) to
+    release it. In "process" mode every call ships a pickled copy of each
+    pipeline to a worker: pipelines must be picklable (a
+    BackgroundReporter is not), and anything the copy changes besides
+    pipeline.stats, such as result cache entries and hit counters, is
+    discarded when the call returns.
+    """
+    EXECUTORS = ("serial", "thread", "process")
+
+    def __init__(
+        self,
+        executor: str = "serial",
+        max_workers: Optional[int] = None,
+        dead_letters: Optional[DeadLetterQueue] = None
+    ) -> None:
+        """
+        Initializes the manager with an empty pipeline registry.
+        executor selects how process_data fans out: "serial", "thread"
+        or "process". Failed records are kept in dead_letters.
+        """
+        if executor not in self.EXECUTORS:
+            raise ValueError(f"Unknown executor: {executor}")
         self.pipelines: List[ProcessingPipeline] = []
         self.stats: defaultdict[str, int] = defaultdict(int)
+        self.executor: str = executor
+        self.max_workers: Optional[int] = max_workers
+        self.dead_letters: DeadLetterQueue = (
+            dead_letters if dead_letters is not None else DeadLetterQueue())
+        self._replay_pool: Optional[ThreadPoolExecutor] = None
+        self._pool: Optional[Executor] = None
+        self._pool_size: int = 0
 
     def add_pipeline(self, pipeline: ProcessingPipeline) -> None:
-        """Registers a pipeline instance into the manager's ecosystem."""
+        """
+        Registers a pipeline instance into the manager's ecosystem. In
+        "process" mode the pipeline is pickled once up front, so a
+        pipeline that cannot cross process boundaries is rejected here
+        instead of failing on every call.
+        """
+        if self.executor == "process":
+            try:
+                pickle.dumps(pipeline)
+            except Exception as e:
+                raise ValueError(
+                    f"Pipeline {pipeline.pipeline_id} cannot be sent to "
+                    f"worker processes: {str(e)}") from e
         self.pipelines.append(pipeline)
 
-    def process_data(self, data: Any) -> None:
-        """Runs data through every registered pipeline independently."""
+    def _get_pool(self) -> Executor:
+        """
+        Returns the shared worker pool, creating it on first use. Without
+        an explicit max_workers the pool has one worker per pipeline, and
+        it is replaced when pipelines were added since it was created.
+        """
+        size: int = self.max_workers or max(1, len(self.pipelines))
+        if self._pool is not None and size > self._pool_size:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+        if self._pool is None:
+            if self.executor == "thread":
+                self._pool = ThreadPoolExecutor(
+                    max_workers=size, thread_name_prefix="nexus")
+            else:
+                self._pool = ProcessPoolExecutor(max_workers=size)
+            self._pool_size = size
+        return self._pool
+
+    def close(self) -> None:
+        """Shuts down the worker pools and closes the dead-letter spill."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=True)
+            self._pool = None
+        if self._replay_pool is not None:
+            self._replay_pool.shutdown(wait=True)
+            self._replay_pool = None
+        self.dead_letters.close()
+
+    def __enter__(self) -> "NexusManager":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def process_data(self, data: Any) -> List[Any]:
+        """
+        Runs data through every registered pipeline independently and
+        returns their results in registration order.
+        """
+        if self.executor == "serial":
+            return self._process_serial(data)
+        return self._process_parallel(data)
+
+    def _process_serial(self, data: Any) -> List[Any]:
+        """Runs each pipeline one after another on the same payload."""
+        results: List[Any] = []
         for pipeline in self.pipelines:
             try:
-                pipeline.process(data)
-                self.stats["processed"] += 1
+                result: Any = pipeline.process(data)
             except Exception as e:
-                self.stats["errors"] += 1
-                print(f"[ERROR] Pipeline {pipeline.pipeline_id} "
-                      f"failed: {str(e)}")
+                results.append(self._record_failure(pipeline, data, e))
+                continue
+            if _is_error_result(result):
+                self.dead_letters.add(
+                    DeadLetter(pipeline.pipeline_id, data, result))
+            results.append(result)
+            self.stats["processed"] += 1
+        return results
+
+    def _process_parallel(self, data: Any) -> List[Any]:
+        """
+        Dispatches the payload to all pipelines at once on the shared
+        thread or process pool. Worker processes operate on pickled
+        copies, so their stats deltas are merged back into the registered
+        pipelines here.
+        """
+        pool: Executor = self._get_pool()
+        results: List[Any] = []
+        futures: List[Future[Tuple[Any, Dict[str, int]]]] = [
+            pool.submit(_run_pipeline, pipeline, data)
+            for pipeline in self.pipelines
+        ]
+        for pipeline, future in zip(self.pipelines, futures):
+            try:
+                result, delta = future.result()
+            except Exception as e:
+                results.append(self._record_failure(pipeline, data, e))
+                continue
+            if self.executor == "process":
+                for key, value in delta.items():
+                    pipeline.stats[key] += value
+            if _is_error_result(result):
+                self.dead_letters.add(
+                    DeadLetter(pipeline.pipeline_id, data, result))
+            results.append(result)
+            self.stats["processed"] += 1
+        return results
+
+    def _record_failure(
+        self, pipeline: ProcessingPipeline, data: Any, error: Exception
+    ) -> str:
+        """
+        Counts and reports a pipeline that raised during processing and
+        captures the payload as a dead letter.
+        """
+        self.stats["errors"] += 1
+        message: str = (f"[ERROR] Pipeline {pipeline.pipeline_id} "
+                        f"failed: {str(error)}")
+        self.dead_letters.add(
+            DeadLetter(pipeline.pipeline_id, data, message))
+        print(message)
+        return message
+
+    def replay_dead_letters(
+        self, backup: ProcessingPipeline, batch_size: int = 256
+    ) -> List[Any]:
+        """
+        Re-drives up to batch_size dead letters through backup in one
+        run_batch call. Records that fail again go back into the queue
+        with their attempt count raised.
+        """
+        entries: List[DeadLetter] = self.dead_letters.drain(batch_size)
+        parsed: List[Any] = []
+        ready: List[DeadLetter] = []
+        for entry in entries:
+            try:
+                parsed.append(backup.parse(entry.payload))
+                ready.append(entry)
+            except Exception as e:
+                self._requeue(entry, backup, f"[ERROR] {str(e)}")
+        results: List[Any] = backup.run_batch(parsed)
+        for entry, result in zip(ready, results):
+            if _is_error_result(result):
+                self._requeue(entry, backup, result)
+            else:
+                self.dead_letters.stats["replayed"] += 1
+                backup.stats["processed"] += 1
+        return results
+
+    def replay_dead_letters_async(
+        self, backup: ProcessingPipeline, batch_size: int = 256
+    ) -> "Future[List[Any]]":
+        """
+        Schedules replay_dead_letters on a dedicated background thread so
+        the main throughput path is never blocked by retries.
+        """
+        if self._replay_pool is None:
+            self._replay_pool = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="dead-letter-replay")
+        return self._replay_pool.submit(
+            self.replay_dead_letters, backup, batch_size)
+
+    def _requeue(
+        self, entry: DeadLetter, backup: ProcessingPipeline, error: str
+    ) -> None:
+        """Puts a record that failed replay back with one more attempt."""
+        self.dead_letters.stats["replay_failed"] += 1
+        self.dead_letters.add(DeadLetter(
+            backup.pipeline_id, entry.payload, error, entry.attempts + 1))
 
     def chain_pipelines(self, data: Any) -> Any:
         """Sequentially passes the output of one pipeline as input to next."""
@@ -305,17 +1897,39 @@ class NexusManager:
                 break
         return result
 
+    def chain_stream(self, records: Iterable[Any]) -> Iterator[Any]:
+        """
+        Streaming variant of chain_pipelines. Records are pulled one at a
+        time through nested generators (A -> B -> C), so memory stays
+        constant and downstream consumers see early results before the
+        input has been fully read.
+        """
+        stream: Iterator[Any] = iter(records)
+        for pipeline in self.pipelines:
+            stream = pipeline.stream_stages(stream)
+        chain_length: int = len(self.pipelines)
+        for result in stream:
+            self.stats["chained"] += chain_length
+            yield result
+
     def get_stats(self) -> Dict[str, int]:
         """Retrieves global performance metrics for all managed pipelines."""
         return {
             "total_pipelines": len(self.pipelines),
             "processed": self.stats["processed"],
             "chained": self.stats["chained"],
-            "errors": self.stats["errors"]
+            "errors": self.stats["errors"],
+            "dead_letters": len(self.dead_letters)
         }
 
-    def simulate_error_recovery(self, data: Any) -> None:
-        """Demonstrates the system's ability to handle and recover faults."""
+    def simulate_error_recovery(
+        self, data: Any, backup: Optional[ProcessingPipeline] = None
+    ) -> None:
+        """
+        Demonstrates the system's ability to handle and recover faults.
+        The failed payload is captured as a dead letter and, when a backup
+        pipeline is given, replayed through it.
+        """
         print("Simulating pipeline failure...")
         try:
             # Simulated failure logic
@@ -323,10 +1937,434 @@ class NexusManager:
         except ValueError as e:
             print(f"Error detected in Stage 2: {str(e)}")
             self.stats["errors"] += 1
+            self.dead_letters.add(DeadLetter(
+                "Stage 2", data, f"[ERROR] {str(e)}"))
             print("Recovery initiated: Switching to backup processor")
+            if backup is not None:
+                self.replay_dead_letters(backup)
             print("Recovery successful: Pipeline restored, processing resumed")
 
 
+class AsyncNexusManager:
+    """
+    Event-loop based manager that keeps many payloads in flight at once.
+    A semaphore bounds concurrent pipeline runs and a bounded queue
+    applies backpressure to the producer.
+    """
+    def __init__(
+        self, max_concurrency: int = 100, queue_size: int = 1000
+    ) -> None:
+        """Initializes the manager with concurrency and queue limits."""
+        self.pipelines: List[ProcessingPipeline] = []
+        self.stats: defaultdict[str, int] = defaultdict(int)
+        self.max_concurrency: int = max_concurrency
+        self.queue_size: int = queue_size
+        self._semaphore: Optional[
+            Tuple[asyncio.AbstractEventLoop, asyncio.Semaphore]] = None
+
+    def add_pipeline(self, pipeline: ProcessingPipeline) -> None:
+        """Registers a pipeline instance into the manager's ecosystem."""
+        self.pipelines.append(pipeline)
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        """
+        Returns the concurrency limiter of the running event loop. A new
+        limiter is created whenever the manager is driven by another
+        loop, e.g. across separate asyncio.run() calls.
+        """
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        if self._semaphore is None or self._semaphore[0] is not loop:
+            self._semaphore = (
+                loop, asyncio.Semaphore(self.max_concurrency))
+        return self._semaphore[1]
+
+    async def _run_one(
+        self, pipeline: ProcessingPipeline, data: Any
+    ) -> Any:
+        """Runs a single pipeline once a concurrency slot is free."""
+        async with self._get_semaphore():
+            result: Any = await pipeline.process_async(data)
+        if isinstance(result, str) and result.startswith("[ERROR]"):
+            self.stats["errors"] += 1
+        else:
+            self.stats["processed"] += 1
+        return result
+
+    def _targets(
+        self, pipeline_id: Optional[str]
+    ) -> List[ProcessingPipeline]:
+        """Selects every pipeline, or only the one matching pipeline_id."""
+        if pipeline_id is None:
+            return self.pipelines
+        targets: List[ProcessingPipeline] = [
+            p for p in self.pipelines if p.pipeline_id == pipeline_id
+        ]
+        if not targets:
+            raise ValueError(f"Unknown pipeline: {pipeline_id}")
+        return targets
+
+    async def process_data(
+        self, data: Any, pipeline_id: Optional[str] = None
+    ) -> List[Any]:
+        """
+        Runs data through the registered pipelines concurrently and
+        returns their results in registration order.
+        """
+        return list(await asyncio.gather(*(
+            self._run_one(pipeline, data)
+            for pipeline in self._targets(pipeline_id)
+        )))
+
+    async def process_stream(
+        self,
+        payloads: Union[Iterable[Any], AsyncIterable[Any]],
+        pipeline_id: Optional[str] = None
+    ) -> List[List[Any]]:
+        """
+        Feeds payloads through a bounded queue to max_concurrency workers.
+        The producer waits whenever the queue is full, so memory stays
+        bounded however fast payloads arrive. Results keep input order.
+        If a worker or the payload source raises, the remaining tasks
+        are cancelled and the exception is re-raised.
+        """
+        self._targets(pipeline_id)
+        pending: asyncio.Queue[Optional[Tuple[int, Any]]] = asyncio.Queue(
+            maxsize=self.queue_size)
+        results: Dict[int, List[Any]] = {}
+        workers_count: int = max(1, self.max_concurrency)
+
+        async def worker() -> None:
+            while True:
+                item: Optional[Tuple[int, Any]] = await pending.get()
+                try:
+                    if item is None:
+                        return
+                    index, payload = item
+                    results[index] = await self.process_data(
+                        payload, pipeline_id)
+                finally:
+                    pending.task_done()
+
+        async def produce() -> int:
+            index: int = 0
+            if isinstance(payloads, AsyncIterable):
+                async for payload in payloads:
+                    await pending.put((index, payload))
+                    index += 1
+            else:
+                for payload in payloads:
+                    await pending.put((index, payload))
+                    index += 1
+            for _ in range(workers_count):
+                await pending.put(None)
+            return index
+
+        workers: List[asyncio.Task[None]] = [
+            asyncio.create_task(worker()) for _ in range(workers_count)
+        ]
+        producer: asyncio.Task[int] = asyncio.create_task(produce())
+        tasks: List[asyncio.Task[Any]] = [producer, *workers]
+        try:
+            done, _ = await asyncio.wait(
+                tasks, return_when=asyncio.FIRST_EXCEPTION)
+            for task in done:
+                error: Optional[BaseException] = task.exception()
+                if error is not None:
+                    raise error
+            count: int = await producer
+            await asyncio.gather(*workers)
+        finally:
+            for task in tasks:
+                task.cancel()
+        return [results[i] for i in range(count)]
+
+    def get_stats(self) -> Dict[str, int]:
+        """Retrieves global performance metrics for all managed pipelines."""
+        return {
+            "total_pipelines": len(self.pipelines),
+            "max_concurrency": self.max_concurrency,
+            "processed": self.stats["processed"],
+            "errors": self.stats["errors"]
+        }
+
+
+def default_shard_pipelines() -> List[ProcessingPipeline]:
+    """Builds the JSON/CSV/Stream adapter set owned by each shard."""
+    return [
+        JSONAdapter("JSON_SHARD"),
+        CSVAdapter("CSV_SHARD"),
+        StreamAdapter("STREAM_SHARD")
+    ]
+
+
+def default_shard_key(record: Any) -> str:
+    """Partitions sensor dicts by their "sensor" field."""
+    if isinstance(record, dict):
+        return str(record.get("sensor", record.get("id", "")))
+    return str(record)
+
+
+class ConsistentHashRing:
+    """
+    Maps keys onto nodes through a ring of virtual points, so adding or
+    removing a node only moves the keys adjacent to its points. Uses a
+    stable digest rather than hash(), which is salted per process.
+    """
+    def __init__(self, nodes: Iterable[int], replicas: int = 64) -> None:
+        """Places replicas virtual points on the ring for every node."""
+        self.replicas: int = replicas
+        self.points: List[int] = []
+        self.owners: List[int] = []
+        for node in nodes:
+            self.add_node(node)
+
+    @staticmethod
+    def _digest(key: str) -> int:
+        """Hashes a key to a stable 64-bit ring position."""
+        return int.from_bytes(
+            hashlib.blake2b(key.encode(), digest_size=8).digest(), "big")
+
+    def add_node(self, node: int) -> None:
+        """Inserts the virtual points of a node into the ring."""
+        for replica in range(self.replicas):
+            point: int = self._digest(f"{node}:{replica}")
+            index: int = bisect_left(self.points, point)
+            self.points.insert(index, point)
+            self.owners.insert(index, node)
+
+    def remove_node(self, node: int) -> None:
+        """Removes every virtual point owned by a node."""
+        kept: List[Tuple[int, int]] = [
+            (point, owner)
+            for point, owner in zip(self.points, self.owners)
+            if owner != node
+        ]
+        self.points = [point for point, _ in kept]
+        self.owners = [owner for _, owner in kept]
+
+    def node_for(self, key: str) -> int:
+        """Returns the node owning the first point clockwise of key."""
+        if not self.points:
+            raise ValueError("Hash ring has no nodes")
+        index: int = bisect_left(self.points, self._digest(key))
+        return self.owners[index % len(self.points)]
+
+
+def _shard_worker(
+    shard_id: int,
+    factory: Callable[[], List[ProcessingPipeline]],
+    inbox: "multiprocessing.Queue[Any]",
+    outbox: "multiprocessing.Queue[Any]"
+) -> None:
+    """
+    Process entry point of a shard. Owns its own NexusManager and handles
+    batches strictly in arrival order, which keeps per-key ordering.
+    Batches travel pickled both ways, so results that cannot be sent
+    back are reported like any other failure: as an ("error", shard_id,
+    (request kind, message)) reply instead of a lost batch.
+    """
+    manager: NexusManager = NexusManager()
+    for pipeline in factory():
+        manager.add_pipeline(pipeline)
+    while True:
+        kind, payload = inbox.get()
+        if kind == "stop":
+            return
+        try:
+            if kind == "batch":
+                outbox.put(("batch", shard_id, pickle.dumps([
+                    (sequence, manager.process_data(record))
+                    for sequence, record in pickle.loads(payload)
+                ], pickle.HIGHEST_PROTOCOL)))
+            elif kind == "stats":
+                outbox.put(("stats", shard_id, {
+                    "manager": manager.get_stats(),
+                    "pipelines": [p.get_stats() for p in manager.pipelines]
+                }))
+        except Exception as e:
+            outbox.put(("error", shard_id,
+                        (kind, f"{type(e).__name__}: {str(e)}")))
+
+
+class ShardedNexusManager:
+    """
+    Spreads records over shards worker processes by consistent hashing
+    of a record key, so throughput scales with cores. Each shard owns its
+    own adapter set, and records sharing a key always land on the same
+    shard and are processed in submission order.
+    """
+    def __init__(
+        self,
+        shards: Optional[int] = None,
+        factory: Callable[[], List[ProcessingPipeline]] = (
+            default_shard_pipelines),
+        key_func: Callable[[Any], str] = default_shard_key,
+        batch_size: int = 256,
+        max_in_flight: int = 64
+    ) -> None:
+        """
+        Starts the shard processes. factory must be picklable (a module
+        level function); max_in_flight caps the batches awaiting results.
+        """
+        self.shards: int = shards or os.cpu_count() or 1
+        self.key_func: Callable[[Any], str] = key_func
+        self.batch_size: int = batch_size
+        self.max_in_flight: int = max_in_flight
+        self.ring: ConsistentHashRing = ConsistentHashRing(
+            range(self.shards))
+        self.outbox: "multiprocessing.Queue[Any]" = multiprocessing.Queue()
+        self.inboxes: List["multiprocessing.Queue[Any]"] = []
+        self.workers: List[multiprocessing.Process] = []
+        for shard_id in range(self.shards):
+            inbox: "multiprocessing.Queue[Any]" = multiprocessing.Queue()
+            worker = multiprocessing.Process(
+                target=_shard_worker,
+                args=(shard_id, factory, inbox, self.outbox),
+                daemon=True)
+            worker.start()
+            self.inboxes.append(inbox)
+            self.workers.append(worker)
+
+    def __enter__(self) -> "ShardedNexusManager":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def shard_for(self, record: Any) -> int:
+        """Returns the shard that owns the record's key."""
+        return self.ring.node_for(self.key_func(record))
+
+    def process_many(self, records: Iterable[Any]) -> List[List[Any]]:
+        """
+        Routes every record to its shard in batches and returns each
+        record's process_data results in input order. A batch that
+        cannot be pickled raises ValueError; a batch that fails in its
+        shard, or a shard that dies, raises RuntimeError. Batches already
+        sent are still collected first, so none of their replies is left
+        behind for the next call.
+        """
+        buffers: List[List[Tuple[int, Any]]] = [
+            [] for _ in range(self.shards)]
+        results: Dict[int, List[Any]] = {}
+        errors: List[str] = []
+        in_flight: int = 0
+        count: int = 0
+        try:
+            for count, record in enumerate(records, 1):
+                shard: int = self.shard_for(record)
+                buffers[shard].append((count - 1, record))
+                if len(buffers[shard]) >= self.batch_size:
+                    self._send(shard, buffers[shard])
+                    buffers[shard] = []
+                    in_flight += 1
+                    while in_flight >= self.max_in_flight:
+                        in_flight -= self._collect(results, errors)
+            for shard, buffer in enumerate(buffers):
+                if buffer:
+                    self._send(shard, buffer)
+                    in_flight += 1
+        finally:
+            while in_flight:
+                in_flight -= self._collect(results, errors)
+        if errors:
+            raise RuntimeError(f"Shard batch failed: {errors[0]}")
+        return [results[sequence] for sequence in range(count)]
+
+    def _send(self, shard: int, batch: List[Tuple[int, Any]]) -> None:
+        """Pickles a batch here, so a bad record fails in the caller."""
+        try:
+            data: bytes = pickle.dumps(batch, pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            raise ValueError(
+                f"Batch for shard {shard} cannot be sent to its worker "
+                f"process: {str(e)}") from e
+        self.inboxes[shard].put(("batch", data))
+
+    def _receive(self) -> Tuple[str, int, Any]:
+        """
+        Waits for the next shard reply, polling so that a shard process
+        that died is reported instead of waited for forever.
+        """
+        while True:
+            try:
+                message: Tuple[str, int, Any] = self.outbox.get(timeout=0.1)
+                return message
+            except queue.Empty:
+                for shard_id, worker in enumerate(self.workers):
+                    if not worker.is_alive():
+                        raise RuntimeError(
+                            f"Shard {shard_id} exited with code "
+                            f"{worker.exitcode}")
+
+    def _collect(
+        self, results: Dict[int, List[Any]], errors: List[str]
+    ) -> int:
+        """
+        Waits for one finished batch and stores its results, or its
+        error message when it failed in the shard.
+        """
+        kind, shard_id, payload = self._receive()
+        if kind == "error" and payload[0] == "batch":
+            errors.append(f"shard {shard_id}: {payload[1]}")
+            return 1
+        if kind != "batch":
+            return 0
+        for sequence, record_results in pickle.loads(payload):
+            results[sequence] = record_results
+        return 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Aggregates manager and pipeline stats across every shard."""
+        for inbox in self.inboxes:
+            inbox.put(("stats", None))
+        totals: defaultdict[str, int] = defaultdict(int)
+        pipelines: Dict[str, defaultdict[str, int]] = {}
+        errors: List[str] = []
+        replies: int = 0
+        while replies < len(self.inboxes):
+            kind, shard_id, payload = self._receive()
+            if kind == "error" and payload[0] == "stats":
+                errors.append(f"shard {shard_id}: {payload[1]}")
+                replies += 1
+                continue
+            if kind != "stats":
+                continue
+            replies += 1
+            for key, value in payload["manager"].items():
+                totals[key] += value
+            for pipeline_stats in payload["pipelines"]:
+                merged = pipelines.setdefault(
+                    str(pipeline_stats["pipeline_id"]), defaultdict(int))
+                for key, value in pipeline_stats.items():
+                    if key == "stages_count":
+                        merged[key] = value
+                    elif isinstance(value, int):
+                        merged[key] += value
+        if errors:
+            raise RuntimeError(f"Shard stats failed: {errors[0]}")
+        return {
+            "shards": self.shards,
+            "total_pipelines": totals["total_pipelines"],
+            "processed": totals["processed"],
+            "errors": totals["errors"],
+            "dead_letters": totals["dead_letters"],
+            "pipelines": {
+                pipeline_id: dict(stats)
+                for pipeline_id, stats in pipelines.items()
+            }
+        }
+
+    def close(self) -> None:
+        """Stops every shard process and waits for it to exit."""
+        for inbox in self.inboxes:
+            inbox.put(("stop", None))
+        for worker in self.workers:
+            worker.join()
+        self.inboxes = []
+        self.workers = []
+
+
 def main() -> None:
     """Main entry point for the Code Nexus pipeline system."""
     print("=== CODE NEXUS - ENTERPRISE PIPELINE SYSTEM ===\n")
@@ -340,9 +2378,10 @@ def main() -> None:
     print("Stage 2: Data transformation and enrichment")
     print("Stage 3: Output formatting and delivery\n")
 
-    json_adapter = JSONAdapter("JSON_001")
-    csv_adapter = CSVAdapter("CSV_001")
-    stream_adapter = StreamAdapter("STREAM_001")
+    console = ConsoleReporter()
+    json_adapter = JSONAdapter("JSON_001", console)
+    csv_adapter = CSVAdapter("CSV_001", console)
+    stream_adapter = StreamAdapter("STREAM_001", console)
 
     manager.add_pipeline(json_adapter)
     manager.add_pipeline(csv_adapter)
@@ -367,7 +2406,8 @@ def main() -> None:
     print("Performance: 95% efficiency, 0.2s total processing time\n")
 
     print("=== Error Recovery Test ===")
-    manager.simulate_error_recovery({"sensor": "temp", "value": 23.5})
+    manager.simulate_error_recovery(
+        {"sensor": "temp", "value": 23.5}, JSONAdapter("BACKUP_001"))
     print()
 
     print("Nexus Integration complete. All systems operational.")